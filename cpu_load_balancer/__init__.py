@@ -1,6 +1,7 @@
 """CPU Load Balancer - Basit ve temiz task execution engine"""
 
-from .engine import Engine
+from typing import TYPE_CHECKING
+
 from .config import EngineConfig
 from .task.task import Task
 from .task.result import Result
@@ -12,6 +13,24 @@ from .core.exceptions import (
     ConfigError
 )
 
+if TYPE_CHECKING:
+    from .engine import Engine
+
+
+def __getattr__(name):
+    """
+    Engine ilk erişimde import edilir (PEP 562)
+    
+    Engine; worker, queue ve psutil zincirini yükler. CLI'nin kısa
+    komutları (--create-config, --help) bu zinciri hiç yüklemez.
+    """
+    if name == "Engine":
+        from .engine import Engine
+        globals()["Engine"] = Engine
+        return Engine
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __version__ = "3.0.0"
 __all__ = [
     'Engine',
@@ -14,8 +14,15 @@ Kullanım:
 """
 
 from dataclasses import dataclass
-from typing import Optional
-import multiprocessing
+from functools import lru_cache
+import os
+from typing import List, Optional
+
+
+@lru_cache(maxsize=None)
+def _default_io_bound_count() -> int:
+    """Varsayılan IO-bound worker sayısı (CPU - 1); process başına bir kez hesaplanır"""
+    return max(1, (os.cpu_count() or 1) - 1)
 
 
 @dataclass
@@ -24,38 +31,50 @@ class EngineConfig:
     Engine yapılandırması - Tüm ayarlar burada
     
     Bu sınıf, Engine'in tüm yapılandırma ayarlarını içerir:
-    - Queue ayarları: Input/Output queue boyutları
+    - Queue ayarları: Input/Output queue ve result cache boyutları
     - Worker ayarları: CPU/IO-bound worker sayıları ve limitler
-    - Genel ayarlar: Log level, timeout değerleri
+    - Genel ayarlar: Log level, timeout değerleri, process start method
     
     Varsayılan değerler makul seçilmiştir, çoğu durumda değiştirmeye gerek yoktur.
     """
     # Queue ayarları
     input_queue_size: int = 1000
     output_queue_size: int = 10000
+    result_cache_size: int = 5000  # Alınmayı bekleyen maksimum sonuç sayısı
+    result_cache_shards: int = 32  # Result cache shard sayısı (2'nin kuvveti)
+    autoscale_queue_watermark: float = 0.5  # Input queue bu doluluğu geçince auto-scaler hemen uyanır
     
     # Worker ayarları
     cpu_bound_count: int = 1
     io_bound_count: Optional[int] = None  # None = otomatik (CPU - 1)
     cpu_bound_task_limit: int = 1
     io_bound_task_limit: int = 20
+    io_warm_count: Optional[int] = None  # Başlangıçta açılacak IO worker sayısı (None = hepsi, gerisi yük geldikçe)
+    cpu_pin_offset: int = 0  # Worker sabitleme sırasının kaydırılması (aynı makinede birden fazla engine)
+    cpu_pin_cores: Optional[List[int]] = None  # CPU-bound worker'lara ayrılan çekirdekler (None = otomatik)
     
     # Genel ayarlar
     log_level: str = "INFO"
     queue_poll_timeout: float = 1.0
+    start_method: Optional[str] = None  # None = platform varsayılanı ("fork", "spawn", "forkserver")
     
     def __post_init__(self):
         """Değerleri doğrula ve otomatik ayarla"""
         # IO-bound count otomatik hesaplama
         if self.io_bound_count is None:
-            cpu_count = multiprocessing.cpu_count()
-            self.io_bound_count = max(1, cpu_count - 1)
+            self.io_bound_count = _default_io_bound_count()
         
         # Validasyon
         if self.input_queue_size < 1:
             raise ValueError("input_queue_size en az 1 olmalı")
         if self.output_queue_size < 1:
             raise ValueError("output_queue_size en az 1 olmalı")
+        if self.result_cache_size < 1:
+            raise ValueError("result_cache_size en az 1 olmalı")
+        if self.result_cache_shards < 1 or self.result_cache_shards & (self.result_cache_shards - 1):
+            raise ValueError("result_cache_shards 2'nin kuvveti olmalı")
+        if not 0.0 < self.autoscale_queue_watermark <= 1.0:
+            raise ValueError("autoscale_queue_watermark 0 ile 1 arasında olmalı")
         if self.cpu_bound_count < 1:
             raise ValueError("cpu_bound_count en az 1 olmalı")
         if self.io_bound_count < 1:
@@ -64,6 +83,13 @@ class EngineConfig:
             raise ValueError("cpu_bound_task_limit en az 1 olmalı")
         if self.io_bound_task_limit < 1:
             raise ValueError("io_bound_task_limit en az 1 olmalı")
+        if self.io_warm_count is not None and self.io_warm_count < 1:
+            raise ValueError("io_warm_count en az 1 olmalı")
+        if self.cpu_pin_offset < 0:
+            raise ValueError("cpu_pin_offset negatif olamaz")
+        if self.cpu_pin_cores is not None and (
+                not self.cpu_pin_cores or any(core < 0 for core in self.cpu_pin_cores)):
+            raise ValueError("cpu_pin_cores boş olmayan, negatif olmayan çekirdek listesi olmalı")
         
         # Log level kontrolü
         valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
@@ -71,4 +97,12 @@ class EngineConfig:
             raise ValueError(f"Geçersiz log_level: {self.log_level}")
         
         self.log_level = self.log_level.upper()
+        
+        # Start method kontrolü
+        if self.start_method is not None:
+            # Config import'u multiprocessing'i yüklemez (CLI kısa komutları için)
+            import multiprocessing
+            valid_methods = multiprocessing.get_all_start_methods()
+            if self.start_method not in valid_methods:
+                raise ValueError(f"Geçersiz start_method: {self.start_method}")
 
@@ -0,0 +1,211 @@
+"""
+Sharded Result Cache
+
+Tamamlanan görevlerin sonuçlarını, get_result ile alınana kadar saklar.
+Cache birden fazla shard'a bölünür; her shard'ın kendi lock'u vardır.
+Böylece result thread'i yazarken get_result çağrıları tek bir global
+lock üzerinde sıraya girmez.
+
+Kullanım:
+    cache = ShardedResultCache(shard_count=32, max_size_per_shard=256)
+    cache.put(task_id, result)
+    result = cache.wait_pop(task_id, timeout=5.0)
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ..task.result import Result
+
+
+class _Shard:
+    """Tek bir shard: LRU sonuç sözlüğü, bekleyenler ve lock"""
+
+    __slots__ = ("lock", "cache", "waiters")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # OrderedDict: En eski sonuç O(1) ile atılır (popitem(last=False))
+        self.cache: "OrderedDict[str, Result]" = OrderedDict()
+        # Sonucu bekleyenler: {task_id: [Event, ...]}
+        self.waiters: Dict[str, List[threading.Event]] = {}
+
+
+class ShardedResultCache:
+    """
+    Sharded Result Cache - Sonuç saklama
+
+    Özellikler:
+    - Shard başına lock: Farklı görevlerin sonuçları birbirini beklemez
+    - LRU eviction: Shard dolarsa en eski sonuç atılır
+    - Bekleme: wait_pop sonuç gelene kadar (veya timeout) bloklar,
+      put sadece ilgili görevi bekleyenleri uyandırır
+    """
+
+    def __init__(self, shard_count: int = 32, max_size_per_shard: int = 256):
+        if shard_count < 1 or shard_count & (shard_count - 1):
+            raise ValueError("shard_count 2'nin kuvveti olmalı (1, 2, 4, 8, ...)")
+        if max_size_per_shard < 1:
+            raise ValueError("max_size_per_shard en az 1 olmalı")
+
+        self._shard_count = shard_count
+        # shard_count 2'nin kuvveti: Modulo yerine bitmask yeterli
+        self._mask = shard_count - 1
+        self._max_size_per_shard = max_size_per_shard
+        self._shards = [_Shard() for _ in range(shard_count)]
+        
+        # Toplam sonuç sayısı: size() shard'ları tek tek kilitlemeden okur
+        # Güncelleme shard lock'u içinde, kısa bir _size_lock ile yapılır
+        self._size = 0
+        self._size_lock = threading.Lock()
+
+    def _get_shard(self, task_id: str) -> _Shard:
+        """
+        Task ID'nin bulunduğu shard
+
+        Cache tek process içinde yaşadığı için built-in hash() yeterli;
+        kriptografik veya process'ler arası sabit bir hash gerekmez.
+        """
+        return self._shards[hash(task_id) & self._mask]
+
+    def put(self, task_id: str, result: Result):
+        """
+        Sonucu ekler ve bu görevi bekleyenleri uyandırır
+
+        Shard doluysa en eski sonuç atılır.
+        """
+        shard = self._get_shard(task_id)
+        with shard.lock:
+            cache = shard.cache
+            before = len(cache)
+            cache[task_id] = result
+            cache.move_to_end(task_id)
+            while len(cache) > self._max_size_per_shard:
+                cache.popitem(last=False)
+            
+            delta = len(cache) - before
+            if delta:
+                with self._size_lock:
+                    self._size += delta
+
+            for waiter in shard.waiters.pop(task_id, ()):
+                waiter.set()
+
+    def put_many(self, items: Iterable[Tuple[str, Result]]):
+        """
+        Birden fazla sonucu ekler (batch)
+        
+        Sonuçlar shard'lara göre gruplanır; her shard'ın lock'u bir kez
+        alınır ve LRU kırpması shard başına bir kez yapılır.
+        """
+        buckets: Dict[int, List[Tuple[str, Result]]] = {}
+        mask = self._mask
+        for item in items:
+            buckets.setdefault(hash(item[0]) & mask, []).append(item)
+        
+        for index, entries in buckets.items():
+            shard = self._shards[index]
+            with shard.lock:
+                cache = shard.cache
+                waiters = shard.waiters
+                before = len(cache)
+                for task_id, result in entries:
+                    cache[task_id] = result
+                    cache.move_to_end(task_id)
+                while len(cache) > self._max_size_per_shard:
+                    cache.popitem(last=False)
+                
+                delta = len(cache) - before
+                if delta:
+                    with self._size_lock:
+                        self._size += delta
+                
+                if waiters:
+                    for task_id, _ in entries:
+                        for waiter in waiters.pop(task_id, ()):
+                            waiter.set()
+    
+    def get(self, task_id: str) -> Optional[Result]:
+        """
+        Sonucu silmeden okur (yoksa None, beklemez)
+        
+        Okunan sonuç LRU sırasında en yeniye taşınır; okunmayı
+        bekleyen sonuçlar eviction'da öne alınmaz.
+        """
+        shard = self._get_shard(task_id)
+        with shard.lock:
+            result = shard.cache.get(task_id)
+            if result is not None:
+                shard.cache.move_to_end(task_id)
+            return result
+    
+    def pop(self, task_id: str) -> Optional[Result]:
+        """Sonucu alır ve siler (yoksa None, beklemez)"""
+        shard = self._get_shard(task_id)
+        with shard.lock:
+            result = shard.cache.pop(task_id, None)
+            if result is not None:
+                with self._size_lock:
+                    self._size -= 1
+            return result
+
+    def wait_pop(self, task_id: str, timeout: Optional[float] = None) -> Optional[Result]:
+        """
+        Sonuç gelene kadar bekler, alır ve siler
+
+        Args:
+            task_id: Görev ID'si
+            timeout: Maksimum bekleme süresi (saniye). None = süresiz bekle
+
+        Returns:
+            Result: Görev sonucu veya None (timeout)
+        """
+        # Monotonic deadline: Saat ayarlamalarından (NTP) etkilenmez
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        shard = self._get_shard(task_id)
+
+        waiter = None
+        while True:
+            with shard.lock:
+                if waiter is not None:
+                    self._discard_waiter(shard, task_id, waiter)
+
+                result = shard.cache.pop(task_id, None)
+                if result is not None:
+                    with self._size_lock:
+                        self._size -= 1
+                    return result
+
+                remaining = None
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return None  # Timeout
+
+                waiter = threading.Event()
+                shard.waiters.setdefault(task_id, []).append(waiter)
+
+            waiter.wait(remaining)
+
+    @staticmethod
+    def _discard_waiter(shard: _Shard, task_id: str, waiter: threading.Event):
+        """Bekleyen Event'i kaydından çıkarır (shard lock'u alınmış olmalı)"""
+        waiters = shard.waiters.get(task_id)
+        if waiters and waiter in waiters:
+            waiters.remove(waiter)
+            if not waiters:
+                del shard.waiters[task_id]
+
+    def size(self) -> int:
+        """Cache'deki toplam sonuç sayısı (O(1), shard lock'u alınmaz)"""
+        return self._size
+
+    def __len__(self) -> int:
+        return self.size()
+
+    def __contains__(self, task_id: str) -> bool:
+        shard = self._get_shard(task_id)
+        with shard.lock:
+            return task_id in shard.cache
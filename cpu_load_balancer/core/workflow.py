@@ -63,35 +63,52 @@ class WorkflowManager:
         Bir görev tamamlandığında çağrılır.
         Yeni açılan (kilidi kalkan) görevleri döndürür.
         """
-        newly_ready_tasks = []
+        with self._lock:
+            return self._complete(result)
+    
+    def tasks_completed(self, results: List[Result]) -> List[Task]:
+        """
+        Birden fazla görev tamamlandığında çağrılır (batch).
         
+        Lock bir kez alınır, tüm sonuçlar işlenir.
+        Yeni açılan görevlerin birleşimini döndürür.
+        """
+        newly_ready_tasks = []
         with self._lock:
-            task_id = result.task_id
-            self._results[task_id] = result
-            
-            # Bu göreve bağımlı olanları bul
-            dependents = self._dependency_graph.get(task_id, [])
-            
-            for dep_id in dependents:
-                if dep_id in self._waiting_counts:
-                    self._waiting_counts[dep_id] -= 1
+            for result in results:
+                newly_ready_tasks.extend(self._complete(result))
+        return newly_ready_tasks
+    
+    def _complete(self, result: Result) -> List[Task]:
+        """Tek bir sonucu işler (lock çağıran tarafından alınmış olmalı)"""
+        newly_ready_tasks = []
+        
+        task_id = result.task_id
+        self._results[task_id] = result
+        
+        # Bu göreve bağımlı olanları bul
+        dependents = self._dependency_graph.get(task_id, [])
+        
+        for dep_id in dependents:
+            if dep_id in self._waiting_counts:
+                self._waiting_counts[dep_id] -= 1
+                
+                # Eğer tüm bağımlılıklar bittiyse
+                if self._waiting_counts[dep_id] == 0:
+                    task = self._tasks[dep_id]
+                    
+                    # Veri Aktarımı (Data Passing):
+                    # Önceki görevin sonucunu, yeni görevin parametrelerine ekle
+                    # Basit bir convention: params['upstream_results'] = {task_id: result_data}
+                    if 'upstream_results' not in task.params:
+                        task.params['upstream_results'] = {}
+                    
+                    # Bağımlı olduğu tüm görevlerin sonuçlarını topla
+                    for dep in task.dependencies:
+                        if dep in self._results:
+                            task.params['upstream_results'][dep] = self._results[dep].data
+                    
+                    newly_ready_tasks.append(task)
+                    del self._waiting_counts[dep_id]
                     
-                    # Eğer tüm bağımlılıklar bittiyse
-                    if self._waiting_counts[dep_id] == 0:
-                        task = self._tasks[dep_id]
-                        
-                        # Veri Aktarımı (Data Passing):
-                        # Önceki görevin sonucunu, yeni görevin parametrelerine ekle
-                        # Basit bir convention: params['upstream_results'] = {task_id: result_data}
-                        if 'upstream_results' not in task.params:
-                            task.params['upstream_results'] = {}
-                        
-                        # Bağımlı olduğu tüm görevlerin sonuçlarını topla
-                        for dep in task.dependencies:
-                            if dep in self._results:
-                                task.params['upstream_results'][dep] = self._results[dep].data
-                        
-                        newly_ready_tasks.append(task)
-                        del self._waiting_counts[dep_id]
-                        
         return newly_ready_tasks
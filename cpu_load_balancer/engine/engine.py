@@ -16,7 +16,7 @@ import logging
 import threading
 import time
 import multiprocessing
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from threading import Lock, Thread
 
 from ..config import EngineConfig
@@ -30,7 +30,12 @@ from ..worker.pool import ProcessPool
 from ..status import ComponentStatus
 from ..core.backpressure import BackpressureController, SystemHealth
 from ..core.workflow import WorkflowManager
+from ..core.result_cache import ShardedResultCache
+from ..task.blob import share_resource_tracker
 
+# Shutdown sinyali: Queue'lara konur, loop'lar get() ile alınca çıkar
+# String: OutputQueue üzerinden pickle edilince de eşitlikle tanınır
+_SHUTDOWN_SENTINEL = "__engine_shutdown__"
 
 class Engine:
     """
@@ -48,6 +53,15 @@ class Engine:
     - Graceful shutdown: Güvenli kapanma
     """
     
+    # Result thread'inin tek seferde işleyeceği maksimum sonuç sayısı
+    RESULT_BATCH_SIZE = 64
+    
+    # Queue thread'inin tek seferde dağıtacağı maksimum görev sayısı
+    TASK_BATCH_SIZE = 64
+    
+    # get_status() snapshot'ının geçerli kalacağı süre (saniye)
+    STATUS_CACHE_TTL = 1.0
+    
     def __init__(self, config: Optional[EngineConfig] = None):
         """
         Engine'i başlatır
@@ -63,7 +77,7 @@ class Engine:
         
         # Durum: Engine'in çalışıp çalışmadığını takip eder
         self._started = False
-        self._lock = Lock()  # Thread-safe işlemler için
+        self._lock = Lock()  # start/shutdown için
         
         # Queue'lar: Görevler ve sonuçlar için
         self._input_queue: Optional[InputQueue] = None   # Görevler buraya gönderilir
@@ -77,11 +91,18 @@ class Engine:
         self._shutdown_event = threading.Event()  # Kapanma sinyali
         
         # Pending tasks: Gönderilen ama henüz tamamlanmamış görevler
+        # Sadece tek anahtarlı set/pop ve update kullanılır (GIL altında atomik, lock yok)
         self._pending_tasks: Dict[str, Task] = {}
         
         # Result cache: Tamamlanan görevlerin sonuçları (batch işlemler için)
         # Queue'dan gelen sonuçlar burada saklanır, istenen task_id gelene kadar bekler
-        self._result_cache: Dict[str, Result] = {}
+        # Shard'lı: Her shard'ın kendi lock'u ve LRU sınırı var
+        # Toplam sınır: result_cache_shards * ceil(result_cache_size / result_cache_shards)
+        shard_count = self._config.result_cache_shards
+        self._result_cache = ShardedResultCache(
+            shard_count=shard_count,
+            max_size_per_shard=-(-self._config.result_cache_size // shard_count)
+        )
         
         # Backpressure Controller: Sistem sağlığını izler
         self._backpressure = BackpressureController()
@@ -94,11 +115,25 @@ class Engine:
         
         # Resource Manager thread: Auto-scaling
         self._resource_manager_thread: Optional[Thread] = None
+        
+        # Status cache: Sık sorgulanan get_status() için son snapshot
+        self._status_cache: Optional[Dict[str, Any]] = None
+        self._status_cached_at = 0.0
 
+        # Auto-scaling durumu (zamanlar time.monotonic() cinsinden)
         self._last_scale_time = 0.0
         self._autoscale_mode = "NORMAL"
-        self._pressure_until = 0
-        self._last_scale_time = 0
+        self._pressure_until = 0.0
+        # Scale-out üst sınırı: CPU sayısı çalışma süresince değişmez, bir kez hesaplanır
+        self._cpu_max_workers = multiprocessing.cpu_count() * 2
+        
+        # Auto-scaler uyandırma: Input queue watermark'ı yukarı geçince (submit)
+        # ve kuyruk boşalınca (result loop) set edilir; yoksa 5 sn'de bir uyanır
+        self._scale_wakeup = threading.Event()
+        self._queue_above_watermark = False
+        self._queue_watermark = max(
+            1, int(self._config.input_queue_size * self._config.autoscale_queue_watermark)
+        )
     
     def start(self):
         """
@@ -116,9 +151,16 @@ class Engine:
             if self._started:
                 raise EngineError("Engine zaten başlatılmış", code="ENG001")
             
+            # multiprocessing context: Worker'lar ve onlarla paylaşılan queue'lar aynı start method'u kullanır
+            ctx = multiprocessing.get_context(self._config.start_method)
+            if ctx.get_start_method() == "forkserver":
+                # Worker modülleri (pool -> process, thread, psutil) forkserver'da bir kez import edilir;
+                # her worker bu hazır process'ten fork'lanır
+                ctx.set_forkserver_preload([ProcessPool.__module__])
+            
             # Queue'ları oluştur: Görevler ve sonuçlar için
             self._input_queue = InputQueue(maxsize=self._config.input_queue_size)
-            self._output_queue = OutputQueue(maxsize=self._config.output_queue_size)
+            self._output_queue = OutputQueue(maxsize=self._config.output_queue_size, ctx=ctx)
             
             # Process pool'u oluştur ve başlat
             # executor_func=None: Process içinde oluşturulacak (pickle sorunu nedeniyle)
@@ -128,8 +170,14 @@ class Engine:
                 io_bound_count=self._config.io_bound_count,
                 cpu_task_limit=self._config.cpu_bound_task_limit,
                 io_task_limit=self._config.io_bound_task_limit,
-                executor_func=None  # Process içinde oluşturulacak
+                executor_func=None,  # Process içinde oluşturulacak
+                ctx=ctx,
+                pin_offset=self._config.cpu_pin_offset,
+                cpu_pin_cores=self._config.cpu_pin_cores,
+                io_warm_count=self._config.io_warm_count
             )
+            # Shared memory blob'ları için worker'lar tek tracker paylaşır
+            share_resource_tracker()
             self._process_pool.start()
             
             # Queue processing thread'i başlat: InputQueue'dan görev alıp worker'lara dağıtır
@@ -145,6 +193,7 @@ class Engine:
             self._resource_manager_thread.start()
             
             self._started = True
+            self._status_cache = None
             self._logger.info("Engine başlatıldı")
     
     def shutdown(self):
@@ -154,11 +203,21 @@ class Engine:
                 return
             
             self._shutdown_event.set()
+            self._scale_wakeup.set()
+            
+            # Queue loop'unu beklediği get() üzerinden uyandır
+            # (Queue doluysa loop ilk boş timeout'ta event'i görür)
+            if self._input_queue:
+                self._input_queue.put(_SHUTDOWN_SENTINEL)
             
             # Process pool'u kapat
             if self._process_pool:
                 self._process_pool.shutdown()
             
+            # Worker'lar kapandı: Sentinel output queue'daki son öğe olur
+            if self._output_queue:
+                self._output_queue.put(_SHUTDOWN_SENTINEL)
+            
             # Thread'lerin bitmesini bekle (daha uzun timeout)
             if self._queue_thread:
                 self._queue_thread.join(timeout=5.0)
@@ -172,6 +231,7 @@ class Engine:
                 self._process_pool.wait_for_shutdown(timeout=10.0)
             
             self._started = False
+            self._status_cache = None
             self._logger.info("Engine kapatıldı")
     
     def submit_task(self, task: Task) -> str:
@@ -185,7 +245,7 @@ class Engine:
             task: Gönderilecek görev (Task objesi)
         
         Returns:
-            str: Görev ID'si (UUID)
+            str: Görev ID'si
         
         Raises:
             EngineError: Engine başlatılmamışsa
@@ -200,22 +260,95 @@ class Engine:
             # Kullanıcıya "Lütfen daha sonra tekrar deneyin" mesajı
             raise TaskError("Sistem aşırı yüklü (Backpressure Active)", code="TASK002")
         
-        # Task'ı dict'e dönüştürüp queue'ya ekle (multiprocessing için)
-        success = self._input_queue.put(task.to_dict())
-        
-        if not success:
-            raise TaskError("Queue dolu, görev eklenemedi", code="TASK001")
-        
         # Pending listesine ekle: Görev takibi için
-        with self._lock:
-            self._pending_tasks[task.id] = task
+        # Kuyruktan önce kaydedilir ki sonuç, kayıttan önce gelip get_result'ta
+        # pop edilirse kayıt sahipsiz kalmasın. Tek anahtarlı dict işlemleri
+        # GIL altında atomik: Lock gerekmez.
+        self._pending_tasks[task.id] = task
+        
+        # Task objesi doğrudan kuyruğa girer (aynı process, dönüşüm yok)
+        if not self._input_queue.put(task):
+            self._pending_tasks.pop(task.id, None)
+            raise TaskError("Queue dolu, görev eklenemedi", code="TASK001")
         
+        self._check_queue_watermark()
         return task.id
+    
+    def submit_tasks(self, tasks: List[Task]) -> List[str]:
+        """
+        Birden fazla bağımsız görevi tek seferde gönderir
+        
+        Backpressure kontrolü, pending kaydı ve kuyruk eklemesi görev başına
+        değil çağrı başına yapılır. Queue processing thread görevleri toplu
+        alır ve worker'lara batch mesajlarla dağıtır.
+        
+        Args:
+            tasks: Gönderilecek görevler (Task objeleri)
+        
+        Returns:
+            List[str]: Görev ID'leri (aynı sırada)
+        
+        Raises:
+            EngineError: Engine başlatılmamışsa
+            TaskError: Sistem aşırı yüklüyse veya queue doluysa (kuyruğa
+                giremeyen ilk görevin ID'si hatada belirtilir, öncekiler gönderilmiştir)
+        """
+        if not self._started:
+            raise EngineError("Engine başlatılmamış", code="ENG002")
+        
+        if tasks:
+            self._submit_batch(tasks)
+        return [t.id for t in tasks]
+    
+    def _submit_batch(self, tasks: List[Task], register_pending: bool = True):
+        """
+        Birden fazla görevi tek seferde gönderir
+        
+        Backpressure kontrolü bir kez yapılır, pending listesi
+        tek bir update ile güncellenir.
+        
+        Args:
+            tasks: Gönderilecek görevler
+            register_pending: False ise görevler pending listesine zaten kayıtlıdır
+        
+        Raises:
+            TaskError: Sistem aşırı yüklüyse veya queue doluysa
+        """
+        if not self._backpressure.should_accept_task():
+            raise TaskError("Sistem aşırı yüklü (Backpressure Active)", code="TASK002")
+        
+        # Pending listesine kuyruktan önce ekle (dict.update GIL altında atomik)
+        if register_pending:
+            self._pending_tasks.update({t.id: t for t in tasks})
+        
+        added = self._input_queue.put_many(tasks)
+        self._check_queue_watermark()
+        
+        if added < len(tasks):
+            # Kuyruğa giremeyenlerin kaydını geri al
+            if register_pending:
+                for t in tasks[added:]:
+                    self._pending_tasks.pop(t.id, None)
+            raise TaskError("Queue dolu, görev eklenemedi", code="TASK001", task_id=tasks[added].id)
             
+    def _check_queue_watermark(self):
+        """
+        Input queue watermark'ı yukarı geçtiyse auto-scaler'ı uyandırır
+        
+        Sadece geçiş anında set edilir; kuyruk yüksek kaldıkça her submit'te
+        tekrar uyandırılmaz.
+        """
+        if not self._queue_above_watermark and self._input_queue.size() >= self._queue_watermark:
+            self._queue_above_watermark = True
+            self._scale_wakeup.set()
+    
     def submit_workflow(self, tasks: list[Task]) -> list[str]:
         """
         Workflow (birbirine bağımlı görevler) gönderir
         
+        Tüm görevler pending listesine ve WorkflowManager'a kaydedilir,
+        hazır olanlar toplu gönderilir.
+        
         Args:
             tasks: Task listesi (bağımlılıkları tanımlanmış)
             
@@ -224,19 +357,18 @@ class Engine:
         """
         if not self._started:
             raise EngineError("Engine başlatılmamış", code="ENG002")
-            
-        # WorkflowManager'a kaydet
-        self._workflow_manager.add_workflow(tasks)
         
-        # Hazır olan görevleri (bağımlılığı olmayanları) hemen kuyruğa at
+        # Pending listesine hepsini ekle (dict.update GIL altında atomik)
+        self._pending_tasks.update({t.id: t for t in tasks})
+        
+        # WorkflowManager'a kaydet ve hazır olanları (bağımlılığı olmayanları) al
+        # WorkflowManager kendi lock'unu kullanır
+        self._workflow_manager.add_workflow(tasks)
         ready_tasks = self._workflow_manager.get_ready_tasks()
-        for task in ready_tasks:
-            self.submit_task(task)
-            
-        # Pending listesine hepsini ekle
-        with self._lock:
-            for task in tasks:
-                self._pending_tasks[task.id] = task
+        
+        # Hazır görevleri hemen kuyruğa at (pending'e zaten kayıtlılar)
+        if ready_tasks:
+            self._submit_batch(ready_tasks, register_pending=False)
                 
         return [t.id for t in tasks]
     
@@ -244,9 +376,9 @@ class Engine:
         """
         Görev sonucunu alır
         
-        Önce result cache'e bakılır (batch işlemler için).
-        Cache'de yoksa OutputQueue'dan alınır.
-        Gelen sonuç istenen task_id değilse cache'e kaydedilir.
+        Sonuçlar result thread tarafından cache'e yazılır.
+        Sonuç henüz gelmediyse bu task_id'ye ait bir Event üzerinde beklenir;
+        result thread sonucu yazınca sadece ilgili bekleyenleri uyandırır.
         
         Args:
             task_id: Görev ID'si
@@ -261,34 +393,17 @@ class Engine:
         if not self._started:
             raise EngineError("Engine başlatılmamış", code="ENG002")
 
-        with self._lock:
-            if task_id in self._result_cache:
-                result = self._result_cache.pop(task_id)
-                self._pending_tasks.pop(task_id, None)
-                return result
-        
-        start_time = time.time()
-        
-        # Artık sonuçları Result Thread topluyor ve Cache'e yazıyor.
-        # Biz sadece Cache'i kontrol edeceğiz.
-        
-        while True:
-            if timeout is not None:
-                elapsed = time.time() - start_time
-                if elapsed >= timeout:
-                    return None  # Timeout
-            
-            # Cache'e bak
-            with self._lock:
-                if task_id in self._result_cache:
-                    result = self._result_cache.pop(task_id) # Al ve sil (veya silme opsiyonel)
-                    # Not: Workflow testlerinde sonucu birden fazla yer isteyebilir, 
-                    # o yüzden pop yerine get kullanmak daha güvenli olabilir ama memory şişer.
-                    # Şimdilik pop yapıyoruz, kullanıcı sorumluluğunda.
-                    self._pending_tasks.pop(task_id, None)
-                    return result
-
-            time.sleep(0.01)
+        # Sonuçları Result Thread topluyor ve Cache'e yazıyor.
+        # Sonuç gelene kadar cache üzerinde bekliyoruz (polling yok).
+        result = self._result_cache.wait_pop(task_id, timeout)
+        if result is None:
+            return None  # Timeout
+        
+        # Not: Workflow testlerinde sonucu birden fazla yer isteyebilir,
+        # o yüzden pop yerine get kullanmak daha güvenli olabilir ama memory şişer.
+        # Şimdilik pop yapıyoruz, kullanıcı sorumluluğunda.
+        self._pending_tasks.pop(task_id, None)  # GIL altında atomik
+        return result
     
     def _process_queue_loop(self):
         """
@@ -296,18 +411,40 @@ class Engine:
         
         Bu metod sürekli InputQueue'dan görev alır ve ProcessPool'a gönderir.
         Load balancing ProcessPool içinde yapılır.
+        
+        Çıkış sinyali kuyruktaki sentinel'dir; shutdown event'i sadece
+        boş geçen (timeout) turlarda kontrol edilir.
         """
-        while not self._shutdown_event.is_set():
+        stop = False
+        while not stop:
             try:
-                task_dict = self._input_queue.get(timeout=self._config.queue_poll_timeout)
+                # Biriken görevleri toplu al: Kuyruk erişimi görev başına değil batch başına
+                tasks = self._input_queue.get_many(
+                    self.TASK_BATCH_SIZE, timeout=self._config.queue_poll_timeout
+                )
                 
-                if task_dict is None:
+                if not tasks:
+                    if self._shutdown_event.is_set():
+                        break
                     continue
 
-                task = Task.from_dict(task_dict)
-                task_type = task.task_type
-
-                self._process_pool.submit_task(task, task_type)
+                # Görevleri tipe göre grupla: Worker yükleri grup başına bir kez okunur
+                by_type: Dict[TaskType, List[Task]] = {}
+                for task in tasks:
+                    if task is _SHUTDOWN_SENTINEL:
+                        stop = True
+                        break
+                    by_type.setdefault(task.task_type, []).append(task)
+                
+                # Serileştirme ProcessPool'da, process sınırında yapılır
+                # Hata sadece o grubu etkiler, diğer tipteki görevler dağıtılır
+                for task_type, group in by_type.items():
+                    try:
+                        self._process_pool.submit_tasks(group, task_type)
+                    except Exception as e:
+                        self._logger.error(
+                            f"Görev dağıtım hatası ({len(group)} görev, ilk: {group[0].id}): {e}"
+                        )
             
             except Exception as e:
                 self._logger.error(f"Queue processing hatası: {e}")
@@ -320,26 +457,46 @@ class Engine:
         OutputQueue'dan sonuçları alır:
         1. Result Cache'e yazar.
         2. WorkflowManager'a bildirir (yeni görevleri tetikler).
+        
+        Çıkış sinyali kuyruktaki sentinel'dir; shutdown event'i sadece
+        boş geçen (timeout) turlarda kontrol edilir.
         """
-        while not self._shutdown_event.is_set():
+        stop = False
+        while not stop:
             try:
-                item = self._output_queue.get(timeout=0.1)
+                # Kuyrukta biriken sonuçları toplu al (batch)
+                # Lock ve workflow maliyeti sonuç başına değil batch başına ödenir
+                items = self._output_queue.get_many(self.RESULT_BATCH_SIZE, timeout=0.1)
+                
+                if not items:
+                    if self._shutdown_event.is_set():
+                        break
+                    continue
+
+                results = []
+                for item in items:
+                    if item == _SHUTDOWN_SENTINEL:
+                        stop = True
+                        break
+                    results.append(Result.from_tuple(item))
                 
-                if item is None:
+                if not results:
                     continue
 
-                result = Result.from_dict(item)
+                # Cache'e yaz: Her shard'ın lock'u batch başına bir kez alınır,
+                # sadece bu sonuçları bekleyenler uyandırılır
+                self._result_cache.put_many([(r.task_id, r) for r in results])
 
-                with self._lock:
-                    self._result_cache[result.task_id] = result
-                    if len(self._result_cache) > 5000:
-                        self._result_cache.pop(next(iter(self._result_cache)))
+                # Yüksek kuyruk boşaldı: Auto-scaler scale-in için hemen değerlendirsin
+                if self._queue_above_watermark and self._input_queue.is_empty():
+                    self._queue_above_watermark = False
+                    self._scale_wakeup.set()
 
-                new_tasks = self._workflow_manager.task_completed(result)
+                new_tasks = self._workflow_manager.tasks_completed(results)
 
-                for task in new_tasks:
+                if new_tasks:
                     try:
-                        self.submit_task(task)
+                        self._submit_batch(new_tasks)
                     except Exception as e:
                         self._logger.error(f"Workflow task submission error: {e}")
                         
@@ -355,15 +512,22 @@ class Engine:
         PRESSURE_HOLD_SEC = 30  # scale-in kilidi
         SCALE_COOLDOWN_SEC = 20
 
-        while not self._shutdown_event.is_set():
-            try:
-                time.sleep(5.0)
+        while True:
+            # En fazla 5 sn bekle: Watermark geçişi veya shutdown hemen uyandırır
+            self._scale_wakeup.wait(5.0)
+            self._scale_wakeup.clear()
+            if self._shutdown_event.is_set():
+                break
 
+            try:
                 if not self._process_pool:
                     continue
 
-                pool_status = self._process_pool.get_status()
-                metrics = getattr(pool_status, "metrics", {}) or {}
+                # Cache atlanır: Watermark uyanmasında 1 sn'ye kadar eski snapshot ile
+                # karar verilmez. Taze snapshot cache'e yazılır, monitörlerle paylaşılır
+                status = self._refresh_status()
+                pool_status = status["components"].get("process_pool", {})
+                metrics = pool_status.get("metrics", {}) or {}
                 cpu_worker_tasks = metrics.get("cpu_worker_tasks", {})
 
                 cpu_worker_count = self._process_pool.get_worker_count(TaskType.CPU_BOUND)
@@ -383,7 +547,8 @@ class Engine:
                 p75_load = loads_sorted[int(len(loads_sorted) * 0.75)]
                 avg_cpu = sum(cpu_usages) / len(cpu_usages)
 
-                now = time.time()
+                # Karar zamanlaması için monotonic saat (duvar saati atlamalarından etkilenmez)
+                now = time.monotonic()
 
                 # --------------------------------------------------
                 # PRESSURE DETECTION (PANIC MODE)
@@ -407,7 +572,7 @@ class Engine:
                 if now - self._last_scale_time < SCALE_COOLDOWN_SEC:
                     continue
 
-                max_workers = multiprocessing.cpu_count() * 2
+                max_workers = self._cpu_max_workers
 
                 # -------- SCALE OUT --------
                 if self._autoscale_mode == "PRESSURE":
@@ -444,10 +609,23 @@ class Engine:
 
             except Exception as e:
                 self._logger.error(f"Resource manager hatası: {e}")
-                time.sleep(5.0)
 
     def get_status(self) -> Dict[str, Any]:
-        """Engine durumu"""
+        """
+        Engine durumu
+        
+        Snapshot STATUS_CACHE_TTL süresince cache'lenir; sık polling yapan
+        monitörler her çağrıda tüm component'leri dolaşmaz.
+        Dönen dict paylaşılır, değiştirilmemelidir.
+        """
+        cached = self._status_cache
+        if cached is not None and time.monotonic() - self._status_cached_at < self.STATUS_CACHE_TTL:
+            return cached
+        return self._refresh_status()
+    
+    def _refresh_status(self) -> Dict[str, Any]:
+        """Component'lerden yeni status snapshot'ı oluşturur ve cache'ler"""
+        now = time.monotonic()
         status = {
             "engine": {
                 "is_running": self._started,
@@ -464,6 +642,8 @@ class Engine:
         if self._process_pool:
             status["components"]["process_pool"] = self._process_pool.get_status().to_dict()
         
+        self._status_cache = status
+        self._status_cached_at = now
         return status
     
     def get_component_status(self, name: str) -> Optional[ComponentStatus]:
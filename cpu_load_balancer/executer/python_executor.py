@@ -2,29 +2,54 @@
 Python Executor Modülü
 
 Bu modül, Python script'lerini dinamik olarak yükler ve çalıştırır.
-Script'lerde main(params, context) fonksiyonu aranır.
+Script'lerde main(params, context) fonksiyonu aranır (async def de olabilir).
 
 Kullanım:
     executor = PythonExecutor()
     result = executor.execute(task, context)
 """
 
+import asyncio
+import hashlib
 import importlib.util
+import inspect
+import json
+import os
 import sys
-from typing import Any, Optional
-from datetime import datetime
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Callable, Optional, Tuple
 
 from ..task.task import Task
 from ..task.result import Result
+from ..task.blob import BLOB_KEY, BlobMapper
 from ..core.enums import TaskStatus
 
 
+@lru_cache(maxsize=1024)
+def _realpath(script_path: str) -> str:
+    """
+    Script'in gerçek yolu (cache'li)
+    
+    realpath her bileşen için lstat/readlink yapar; aynı yol için
+    sonuç process içinde bir kez hesaplanır.
+    """
+    return os.path.realpath(script_path)
+
+
 class ExecutionContext:
     """
     Execution Context - Script'e geçirilecek bilgiler
     
     Script'ler bu context'i kullanarak görev ve worker bilgisine erişebilir.
+    
+    __slots__: Instance başına __dict__ oluşturulmaz. Worker thread'leri
+    tek bir context'i yeniden kullanır, görev başına sadece task_id değişir.
     """
+    __slots__ = ("task_id", "worker_id")
+    
     def __init__(self, task_id: str, worker_id: str):
         self.task_id = task_id    # Görev ID'si
         self.worker_id = worker_id  # Worker ID'si (örn: "io-0")
@@ -40,10 +65,42 @@ class PythonExecutor:
     - Module cache: Script'leri cache'ler (performans için)
     - main() fonksiyonu: Script'te main(params, context) fonksiyonu aranır
     - Hata yönetimi: Hata durumunda failed result döndürür
+    - Sonuç memoization: memoizable görevlerde (script, params) -> data
+    - Specialize: Script başına main() ve Result fabrikalarını bağlayan runner
+    - Shared memory blob'lar: Task.attach_blob parametreleri memoryview olarak verilir
+    - async def main: Process genelinde tek event loop'ta çalışır; bekleyen
+      IO'lar thread başına ayrı loop olmadan aynı loop'ta örtüşür
     """
     
+    # Script mtime kontrolü en fazla bu sıklıkta yapılır (saniye)
+    # Aynı script art arda çalışırken her görevde stat() çağrılmaz
+    STAT_TTL = 1.0
+    # Cache'de tutulan en fazla script modülü (LRU, fazlası sys.modules'dan da çıkarılır)
+    MODULE_CACHE_SIZE = 256
+    
+    # Memoization: Process genelinde paylaşılır (executor thread başına oluşturulur)
+    RESULT_MEMO_SIZE = 4096
+    _result_memo: "OrderedDict[Tuple[str, Tuple, bytes], Any]" = OrderedDict()
+    _result_memo_lock = threading.Lock()
+    
+    # Shared memory blokları görev süresince açılır (bkz. BlobMapper)
+    _blob_mapper = BlobMapper()
+    
+    # async main() script'leri için event loop: İlk kullanımda daemon thread'de başlar
+    _async_loop: Optional[asyncio.AbstractEventLoop] = None
+    _async_loop_lock = threading.Lock()
+    
+    # {realpath: (file_key, module, main, checked_at)} - Script değişirse yeniden yüklenir
+    # file_key = (st_mtime_ns, st_size, st_ino)
+    # realpath anahtarı: Göreli yol / symlink ile gelen aynı script bir kez yüklenir
+    # Process genelinde paylaşılır: Executor thread başına olsa da script process
+    # başına bir kez yüklenir. Okuma lock'suz, yükleme/çıkarma lock altında
+    _module_cache: "OrderedDict[str, Tuple]" = OrderedDict()
+    _module_cache_lock = threading.Lock()
+    
     def __init__(self):
-        self._module_cache = {}  # Basit cache
+        # {realpath: (main, runner)} - main değişince (reload) runner yeniden üretilir
+        self._runners = {}
     
     def execute(self, task: Task, context: ExecutionContext) -> Result:
         """
@@ -59,27 +116,53 @@ class PythonExecutor:
         Returns:
             Result: Başarılı veya başarısız sonuç
         """
-        from datetime import timezone
-        started_at = datetime.now(timezone.utc)  # Timezone-aware datetime
+        if not task.memoizable:
+            # Hızlı yol: Script'e özel runner (main ve fabrikalar yerel değişkende)
+            try:
+                run = self.specialize(task.script_path)
+            except Exception as e:
+                return Result.failed(
+                    task_id=task.id,
+                    error=str(e),
+                    started_ns=time.time_ns()
+                )
+            return run(task, context)
+        
+        # time_ns(): Tek clock_gettime çağrısı, datetime oluşturulmaz
+        started_ns = time.time_ns()
         
         try:
             # Script'i yükle (cache'den veya dosyadan)
-            module = self._load_module(task.script_path)
+            # main() yükleme sırasında bir kez çözülür ve modülle birlikte cache'lenir
+            # Memo anahtarı yüklenen script sürümüne bağlı olduğu için önce yüklenir
+            _, main_func = self._load_module(task.script_path)
             
-            # main() fonksiyonunu bul
-            if not hasattr(module, 'main'):
-                raise ValueError(f"Script'te 'main' fonksiyonu bulunamadı: {task.script_path}")
-            
-            main_func = module.main
+            memo_key = self._memo_key(task)
+            if memo_key is not None:
+                with self._result_memo_lock:
+                    if memo_key in self._result_memo:
+                        self._result_memo.move_to_end(memo_key)
+                        return Result.success(
+                            task_id=task.id,
+                            data=self._result_memo[memo_key],
+                            started_ns=started_ns
+                        )
             
             # Script'i çalıştır: main(params, context)
-            data = main_func(task.params, context)
+            params = task.params
+            if BLOB_KEY in params:
+                data = self._blob_mapper.call(main_func, params, context)
+            else:
+                data = main_func(params, context)
+            
+            if memo_key is not None:
+                self._memoize(memo_key, data)
             
             # Başarılı sonuç döndür
             return Result.success(
                 task_id=task.id,
                 data=data,
-                started_at=started_at
+                started_ns=started_ns
             )
         
         except Exception as e:
@@ -87,39 +170,206 @@ class PythonExecutor:
             return Result.failed(
                 task_id=task.id,
                 error=str(e),
-                started_at=started_at
+                started_ns=started_ns
             )
     
+    def specialize(self, script_path: str) -> Callable[[Task, ExecutionContext], Result]:
+        """
+        Script'e özel çalıştırıcı döndürür
+        
+        main(), Result.success/failed ve saat fonksiyonu default argüman
+        olarak bağlanır; her çağrı global/attribute araması yerine yerel
+        değişken okur. Runner main() başına bir kez üretilir, script
+        yeniden yüklenince (main değişince) yenilenir.
+        
+        Args:
+            script_path: Script dosya yolu
+        
+        Returns:
+            Callable: run(task, context) -> Result
+        
+        Raises:
+            ValueError: Script yüklenemezse veya main() yoksa
+        """
+        _, main_func = self._load_module(script_path)
+        
+        path = _realpath(script_path)
+        cached = self._runners.get(path)
+        if cached is not None and cached[0] is main_func:
+            return cached[1]
+        
+        def run(task, context, _main=main_func, _success=Result.success,
+                _failed=Result.failed, _now=time.time_ns, _blob_key=BLOB_KEY,
+                _call_blobs=self._blob_mapper.call):
+            started_ns = _now()
+            try:
+                params = task.params
+                if _blob_key in params:
+                    return _success(task.id, _call_blobs(_main, params, context), None, started_ns)
+                return _success(task.id, _main(params, context), None, started_ns)
+            except Exception as e:
+                return _failed(task.id, str(e), None, started_ns)
+        
+        self._runners[path] = (main_func, run)
+        return run
+    
+    @classmethod
+    def _memo_key(cls, task: Task) -> Optional[Tuple[str, Tuple, bytes]]:
+        """
+        Memoization anahtarı: (realpath, file_key, params özeti)
+        
+        _load_module'den sonra çağrılır. file_key yüklü script sürümüdür:
+        Script değişip yeniden yüklenince eski sonuçlar eşleşmez.
+        Params JSON'a çevrilemiyorsa veya script cache'de yoksa None
+        döner (memoize edilmez).
+        """
+        path = _realpath(task.script_path)
+        cached = cls._module_cache.get(path)
+        if cached is None:
+            return None
+        try:
+            canonical = json.dumps(task.params, sort_keys=True, separators=(",", ":"))
+        except (TypeError, ValueError):
+            return None
+        digest = hashlib.blake2b(canonical.encode(), digest_size=16).digest()
+        return (path, cached[0], digest)
+    
+    @classmethod
+    def _memoize(cls, key: Tuple[str, Tuple, bytes], data: Any):
+        """Sonucu memo'ya ekler (LRU, RESULT_MEMO_SIZE ile sınırlı)"""
+        with cls._result_memo_lock:
+            cls._result_memo[key] = data
+            cls._result_memo.move_to_end(key)
+            if len(cls._result_memo) > cls.RESULT_MEMO_SIZE:
+                cls._result_memo.popitem(last=False)
+    
     def _load_module(self, script_path: str):
         """
         Script'i yükler (cache ile)
         
-        Script daha önce yüklenmişse cache'den döner.
-        Yoksa dosyadan yükler ve cache'e ekler.
+        Script daha önce yüklenmişse ve dosya değişmemişse (mtime, boyut,
+        inode) cache'den döner. Yoksa dosyadan yükler ve cache'e ekler.
+        Son kontrolün üzerinden STAT_TTL geçmediyse stat() atlanır.
+        Cache MODULE_CACHE_SIZE ile sınırlı LRU'dur ve process genelinde
+        paylaşılır; aynı script'i aynı anda isteyen thread'lerden biri yükler.
         
         Args:
             script_path: Script dosya yolu
         
         Returns:
-            Module: Yüklenen modül
+            Tuple: (modül, main fonksiyonu)
         
         Raises:
-            ValueError: Script yüklenemezse
+            ValueError: Script yüklenemezse veya main() yoksa
         """
-        # Cache'de varsa direkt döndür
-        if script_path in self._module_cache:
-            return self._module_cache[script_path]
+        now = time.monotonic()
+        path = _realpath(script_path)
+        cache = self._module_cache
+        cached = cache.get(path)
+        
+        # Yakın zamanda kontrol edildiyse dosyaya hiç bakmadan döndür
+        if cached is not None and now - cached[3] < self.STAT_TTL:
+            try:
+                cache.move_to_end(path)
+            except KeyError:
+                pass  # Başka thread bu arada cache'den çıkardı; modül yine geçerli
+            return cached[1], self._require_main(cached[2], script_path)
+        
+        with self._module_cache_lock:
+            return self._load_module_locked(script_path, path, now)
+    
+    def _load_module_locked(self, script_path: str, path: str, now: float):
+        """_load_module yavaş yolu (_module_cache_lock altında çağrılır)"""
+        cache = self._module_cache
+        # Lock beklenirken başka thread yüklemiş/kontrol etmiş olabilir
+        cached = cache.get(path)
+        if cached is not None and now - cached[3] < self.STAT_TTL:
+            cache.move_to_end(path)
+            return cached[1], self._require_main(cached[2], script_path)
+        
+        # Tek stat(): mtime aynı kalsa bile boyut/inode değişimi (geçici dosyaya
+        # yazıp rename eden editörler) yeniden yüklemeyi tetikler
+        st = os.stat(path)
+        file_key = (st.st_mtime_ns, st.st_size, st.st_ino)
+        
+        # Cache'de varsa ve script değişmemişse direkt döndür
+        if cached is not None and cached[0] == file_key:
+            cache[path] = (file_key, cached[1], cached[2], now)
+            cache.move_to_end(path)
+            return cached[1], self._require_main(cached[2], script_path)
+        
+        # Her script kendi modül adını alır: Farklı script'ler sys.modules'da
+        # birbirinin yerine geçmez
+        module_name = self.module_name(path)
         
         # Script'i dosyadan yükle
-        spec = importlib.util.spec_from_file_location("task_module", script_path)
+        spec = importlib.util.spec_from_file_location(module_name, path)
         if spec is None or spec.loader is None:
             raise ValueError(f"Script yüklenemedi: {script_path}")
         
         # Modülü oluştur ve çalıştır
         module = importlib.util.module_from_spec(spec)
-        sys.modules["task_module"] = module
+        sys.modules[module_name] = module
         spec.loader.exec_module(module)
         
+        main_func = getattr(module, "main", None)
+        if main_func is not None and inspect.iscoroutinefunction(main_func):
+            # async def main: Çağıranlar için senkron sarmalayıcı bir kez üretilir
+            main_func = self._async_main(main_func)
+        
         # Cache'e ekle (bir sonraki kullanım için)
-        self._module_cache[script_path] = module
-        return module
\ No newline at end of file
+        # main() olmayan script de cache'lenir: Her görevde yeniden exec edilmez
+        cache[path] = (file_key, module, main_func, now)
+        cache.move_to_end(path)
+        while len(cache) > self.MODULE_CACHE_SIZE:
+            evicted_path, evicted = cache.popitem(last=False)
+            self._runners.pop(evicted_path, None)
+            sys.modules.pop(evicted[1].__name__, None)
+        return module, self._require_main(main_func, script_path)
+    
+    @classmethod
+    def _event_loop(cls) -> asyncio.AbstractEventLoop:
+        """Process genelindeki event loop (yoksa daemon thread'de başlatılır)"""
+        loop = cls._async_loop
+        if loop is None:
+            with cls._async_loop_lock:
+                loop = cls._async_loop
+                if loop is None:
+                    loop = asyncio.new_event_loop()
+                    threading.Thread(
+                        target=loop.run_forever,
+                        name="executor-event-loop",
+                        daemon=True
+                    ).start()
+                    cls._async_loop = loop
+        return loop
+    
+    @classmethod
+    def _async_main(cls, main_func: Callable) -> Callable:
+        """
+        async main() için senkron çalıştırıcı
+        
+        Coroutine process'in event loop'una gönderilir, çağıran thread sonucu
+        bekler. Context görev bitene kadar değişmez (thread bloklu bekler).
+        """
+        def run_async(params, context, _submit=asyncio.run_coroutine_threadsafe):
+            return _submit(main_func(params, context), cls._event_loop()).result()
+        return run_async
+    
+    @staticmethod
+    def _require_main(main_func, script_path: str):
+        """main() yoksa ValueError fırlatır"""
+        if main_func is None:
+            raise ValueError(f"Script'te 'main' fonksiyonu bulunamadı: {script_path}")
+        return main_func
+    
+    @staticmethod
+    def module_name(script_path: str) -> str:
+        """
+        Script yoluna özgü, process'ler arası sabit modül adı
+        
+        Gerçek yol (realpath) kullanılır: Aynı dosyaya göreli yol veya
+        symlink ile ulaşan görevler aynı modül adını paylaşır.
+        """
+        digest = hashlib.blake2b(_realpath(script_path).encode(), digest_size=8).hexdigest()
+        return f"task_module_{digest}"
@@ -9,19 +9,24 @@ Kullanım:
 """
 
 import argparse
+import selectors
+import signal
 import sys
 import os
-import signal
 import time
 import json
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
-from .engine import Engine
 from .config import EngineConfig
 from .task.task import Task
 from .core.enums import TaskType
-from .core.exceptions import EngineError, TaskError
+from .core.exceptions import TaskError
+
+# Engine sadece start()'ta import edilir: --create-config gibi kısa komutlar
+# worker/multiprocessing zincirini hiç yüklemez
+if TYPE_CHECKING:
+    from .engine import Engine
 
 
 class CPULoadBalancerApp:
@@ -29,11 +34,25 @@ class CPULoadBalancerApp:
     
     def __init__(self, config: Optional[EngineConfig] = None):
         self.config = config or EngineConfig()
-        self.engine: Optional[Engine] = None
+        self.engine: Optional["Engine"] = None
         self.running = False
+        # Signal -> pipe (set_wakeup_fd): Kapanma ana döngüde, ana thread'de yapılır
+        self._stop_requested = False
+        self._wakeup_r: Optional[int] = None
+        self._wakeup_w: Optional[int] = None
+        self._selector = None
+        # Ana thread _read_line'ın select'inde mi: Signal sadece orada pipe ile
+        # işlenir, başka yerde (örn: get_result beklerken) KeyboardInterrupt ile kesilir
+        self._in_select = False
+        # Selector kullanılırken stdin fd'den ham okunur; tamamlanmamış/okunmamış
+        # satırlar burada bekler (tek os.read birden fazla satır getirebilir)
+        self._stdin_fd: Optional[int] = None
+        self._stdin_buf = b""
     
     def start(self):
         """Engine'i başlat"""
+        from .engine import Engine
+        
         print("🚀 CPU Load Balancer başlatılıyor...")
         print(f"   Config: cpu_bound={self.config.cpu_bound_count}, "
               f"io_bound={self.config.io_bound_count}")
@@ -44,6 +63,7 @@ class CPULoadBalancerApp:
             self.running = True
             
             # Signal handler'ları ayarla
+            self._setup_wakeup_fd()
             signal.signal(signal.SIGINT, self._signal_handler)
             signal.signal(signal.SIGTERM, self._signal_handler)
             
@@ -61,12 +81,120 @@ class CPULoadBalancerApp:
             self.engine.shutdown()
             self.running = False
             print("✅ Engine kapatıldı")
+        self._close_wakeup_fd()
+    
+    def _setup_wakeup_fd(self):
+        """
+        Signal'leri okunabilir bir pipe olayına çevirir (POSIX)
+        
+        Signal geldiğinde C handler signal numarasını pipe'a yazar;
+        interactive döngü stdin ile birlikte pipe'ı da bekler ve temiz
+        çıkar. Shutdown handler içinden, rastgele bir noktada çağrılmaz.
+        """
+        if os.name != "posix":
+            return
+        
+        r, w = os.pipe()
+        os.set_blocking(r, False)
+        os.set_blocking(w, False)
+        signal.set_wakeup_fd(w)
+        
+        self._wakeup_r, self._wakeup_w = r, w
+        selector = selectors.DefaultSelector()
+        selector.register(r, selectors.EVENT_READ)
+        try:
+            stdin_fd = sys.stdin.fileno()
+            selector.register(stdin_fd, selectors.EVENT_READ)
+        except (OSError, ValueError):
+            # stdin seçilebilir değil (örn: dosyadan yönlendirme): input() ile okunur
+            selector.close()
+            return
+        self._selector = selector
+        self._stdin_fd = stdin_fd
+    
+    def _close_wakeup_fd(self):
+        """Wakeup pipe'ını kapatır ve signal.set_wakeup_fd'yi sıfırlar"""
+        if self._wakeup_r is None:
+            return
+        
+        signal.set_wakeup_fd(-1)
+        if self._selector is not None:
+            self._selector.close()
+        os.close(self._wakeup_r)
+        os.close(self._wakeup_w)
+        self._selector = None
+        self._stdin_fd = None
+        self._wakeup_r = self._wakeup_w = None
     
     def _signal_handler(self, signum, frame):
-        """Signal handler - graceful shutdown"""
-        print(f"\n⚠️  Signal alındı ({signum}), kapatılıyor...")
-        self.shutdown()
-        sys.exit(0)
+        """
+        Signal handler - sadece kapanma isteğini işaretler
+        
+        Asıl shutdown ana döngüden çıkıldıktan sonra main()'de yapılır.
+        Ana thread _read_line'ın select'inde değilse (input(), get_result
+        beklemesi vb.) bloklayan çağrıyı kesmek için KeyboardInterrupt
+        yükseltilir; select'teyse pipe onu zaten uyandırır.
+        """
+        self._stop_requested = True
+        if not self._in_select:
+            print(f"\n⚠️  Signal alındı ({signum}), kapatılıyor...")
+            raise KeyboardInterrupt
+    
+    def _read_line(self, prompt: str) -> Optional[str]:
+        """
+        Kullanıcıdan bir satır okur
+        
+        Returns:
+            str: Okunan satır, signal veya EOF durumunda None
+        """
+        if self._stop_requested:
+            return None
+        
+        if self._selector is None:
+            return input(prompt)
+        
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        
+        self._in_select = True
+        try:
+            return self._select_line()
+        finally:
+            self._in_select = False
+    
+    def _select_line(self) -> Optional[str]:
+        """_read_line'ın select döngüsü (stdin veya signal pipe'ı beklenir)"""
+        while True:
+            # Önceki okumadan kalan satır varsa select beklenmez: Veri zaten
+            # okunmuş olduğu için fd bir daha okunabilir görünmeyebilir
+            newline = self._stdin_buf.find(b"\n")
+            if newline >= 0:
+                line = self._stdin_buf[:newline + 1]
+                self._stdin_buf = self._stdin_buf[newline + 1:]
+                return self._decode_line(line)
+            
+            for key, _ in self._selector.select():
+                if key.fileobj == self._wakeup_r:
+                    try:
+                        signums = os.read(self._wakeup_r, 512)
+                    except BlockingIOError:
+                        signums = b""
+                    if self._stop_requested:
+                        signum = signums[-1] if signums else "?"
+                        print(f"\n⚠️  Signal alındı ({signum}), kapatılıyor...")
+                        return None
+                else:
+                    chunk = os.read(self._stdin_fd, 4096)
+                    if not chunk:
+                        # EOF: Sonunda newline olmayan son satır da döner
+                        line, self._stdin_buf = self._stdin_buf, b""
+                        return self._decode_line(line) if line else None
+                    self._stdin_buf += chunk
+    
+    @staticmethod
+    def _decode_line(line: bytes) -> str:
+        """Ham stdin satırını stdin'in encoding'i ile çözer"""
+        return line.decode(sys.stdin.encoding or "utf-8", errors="replace")
     
     def show_status(self):
         """Engine durumunu göster"""
@@ -101,7 +229,10 @@ class CPULoadBalancerApp:
         
         while self.running:
             try:
-                command = input("\n> ").strip()
+                command = self._read_line("\n> ")
+                if command is None:
+                    break
+                command = command.strip()
                 
                 if not command:
                     continue
@@ -177,7 +308,10 @@ class CPULoadBalancerApp:
         print("\n🎬 Demo Mode - Örnek görevler çalıştırılıyor...")
         
         # Örnek script path'i (kullanıcı kendi script'ini belirtebilir)
-        demo_script = input("   Script path (boş bırakırsanız demo atlanır): ").strip()
+        demo_script = self._read_line("   Script path (boş bırakırsanız demo atlanır): ")
+        if demo_script is None:
+            return
+        demo_script = demo_script.strip()
         
         if not demo_script:
             print("   Demo atlandı")
@@ -225,18 +359,25 @@ def load_config_from_file(config_path: str) -> Optional[EngineConfig]:
                 if config_path_in_dir.exists():
                     config_path = str(config_path_in_dir)
         
-        with open(config_path, 'r') as f:
-            data = json.load(f)
+        # Tek read + C scanner: json.load'un dosya okuma sarmalayıcısı atlanır
+        data = json.loads(Path(config_path).read_bytes())
         
         return EngineConfig(
             input_queue_size=data.get("input_queue_size", 1000),
             output_queue_size=data.get("output_queue_size", 10000),
+            result_cache_size=data.get("result_cache_size", 5000),
+            result_cache_shards=data.get("result_cache_shards", 32),
+            autoscale_queue_watermark=data.get("autoscale_queue_watermark", 0.5),
             cpu_bound_count=data.get("cpu_bound_count", 1),
             io_bound_count=data.get("io_bound_count", None),
             cpu_bound_task_limit=data.get("cpu_bound_task_limit", 1),
             io_bound_task_limit=data.get("io_bound_task_limit", 20),
+            io_warm_count=data.get("io_warm_count", None),
+            cpu_pin_offset=data.get("cpu_pin_offset", 0),
+            cpu_pin_cores=data.get("cpu_pin_cores", None),
             log_level=data.get("log_level", "INFO"),
-            queue_poll_timeout=data.get("queue_poll_timeout", 1.0)
+            queue_poll_timeout=data.get("queue_poll_timeout", 1.0),
+            start_method=data.get("start_method", None)
         )
     
     except Exception as e:
@@ -255,16 +396,23 @@ def create_default_config_file(path: Optional[str] = None):
     default_config = {
         "input_queue_size": 1000,
         "output_queue_size": 10000,
+        "result_cache_size": 5000,
+        "result_cache_shards": 32,
+        "autoscale_queue_watermark": 0.5,
         "cpu_bound_count": 1,
         "io_bound_count": None,
         "cpu_bound_task_limit": 1,
         "io_bound_task_limit": 20,
+        "io_warm_count": None,
+        "cpu_pin_offset": 0,
+        "cpu_pin_cores": None,
         "log_level": "INFO",
-        "queue_poll_timeout": 1.0
+        "queue_poll_timeout": 1.0,
+        "start_method": None
     }
     
-    with open(path, 'w') as f:
-        json.dump(default_config, f, indent=2)
+    # json.dump parça parça write eder; string tek seferde yazılır
+    Path(path).write_text(json.dumps(default_config, indent=2))
     
     print(f"✅ Varsayılan config dosyası oluşturuldu: {path}")
 
@@ -390,6 +538,9 @@ def main():
             print("\n💡 Interactive mode'a geçiliyor...")
             app.run_interactive()
     
+    except KeyboardInterrupt:
+        pass  # Signal: Mesaj handler'da yazıldı, kapanış aşağıda
+    
     finally:
         app.shutdown()
     
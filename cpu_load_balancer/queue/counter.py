@@ -0,0 +1,49 @@
+"""
+Lock'suz Sayaç Modülü
+
+Queue'ların put/get sayaçları için lock gerektirmeyen sayaç.
+itertools.count C'de çalışır: next() GIL altında bölünmez, bu yüzden
+sıcak yolda lock alıp bırakmaya gerek kalmaz.
+
+Kullanım:
+    counter = AtomicCounter()
+    counter.increment()
+    counter.add(10)
+    print(counter.value)  # 11
+"""
+
+import itertools
+import threading
+from collections import deque
+from functools import partial
+
+
+class AtomicCounter:
+    """
+    Atomic Counter - Lock'suz artan sayaç
+
+    Sadece artar; değer okuma nadir (status) olduğu için okuma da
+    sayacı ilerletir ve okuma sayısı ayrıca tutularak düşülür.
+    Okumalar kendi aralarında lock ile sıralanır (yazanlar lock almaz).
+    """
+
+    __slots__ = ("_count", "_reads", "_read_lock", "increment")
+
+    def __init__(self, start: int = 0):
+        self._count = itertools.count(start)
+        self._reads = itertools.count()
+        # İki next() arasına başka bir okuma girerse değer ±1 kayar ve geri gidebilir
+        self._read_lock = threading.Lock()
+        # Bound C çağrısı: increment() Python frame'i açmaz
+        self.increment = partial(next, self._count)
+
+    def add(self, n: int):
+        """Sayacı n kadar artırır (tek C döngüsünde)"""
+        if n > 0:
+            deque(itertools.islice(self._count, n), maxlen=0)
+
+    @property
+    def value(self) -> int:
+        """Güncel değer (okuma başına bir kez ilerletilir ve düşülür)"""
+        with self._read_lock:
+            return next(self._count) - next(self._reads)
@@ -2,21 +2,22 @@
 Input Queue Modülü
 
 Bu modül, görevlerin gönderildiği kuyruğu yönetir.
-Multiprocessing.Queue kullanır ve status takibi sağlar.
+Engine ile queue processing thread'i aynı process'te çalıştığı için
+thread-safe queue.Queue kullanır: Task objeleri pickle/dict dönüşümü
+olmadan aktarılır. Serileştirme ProcessPool'da, worker'a gönderimde yapılır.
 
 Kullanım:
     queue = InputQueue(maxsize=1000)
-    queue.put(task_dict)
+    queue.put(task)
     task = queue.get(timeout=1.0)
 """
 
-import multiprocessing
 import queue
-from typing import Any, Dict, Optional
-from threading import Lock
+from typing import Any, Iterable, List, Optional
 from datetime import datetime, timezone
 
 from ..status import ComponentStatus
+from .counter import AtomicCounter
 
 
 class InputQueue:
@@ -31,37 +32,62 @@ class InputQueue:
     - Status takibi: Queue boyutu, toplam gönderilen görev sayısı
     """
     def __init__(self, maxsize: int = 1000):
-        self._queue = multiprocessing.Queue(maxsize=maxsize)
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=maxsize)
+        self._items = self._queue.queue  # Alttaki deque (lock'suz boyut okuma için)
         self._created_at = datetime.now(timezone.utc)
         self._maxsize = maxsize
-        self._total_put = 0
-        self._total_dropped = 0
-        self._lock = Lock()
+        # Lock'suz sayaçlar: put sıcak yolunda lock alınmaz
+        self._total_put = AtomicCounter()
+        self._total_dropped = AtomicCounter()
 
-    def put(self, item: Dict[str, Any]) -> bool:
+    def put(self, item: Any) -> bool:
         """
         Görev ekler (non-blocking)
         
         Queue doluysa False döner, görev eklenmez.
         
         Args:
-            item: Görev dict'i (Task.to_dict() sonucu)
+            item: Görev (Task objesi)
         
         Returns:
             bool: True ise başarılı, False ise queue dolu
         """
         try:
             self._queue.put_nowait(item)
-            with self._lock:
-                self._total_put += 1
+            self._total_put.increment()
             return True
         except queue.Full:
             # Queue dolu, görev eklenemedi
-            with self._lock:
-                self._total_dropped += 1
-            return False 
+            self._total_dropped.increment()
+            return False
 
-    def get(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+    def put_many(self, items: Iterable[Any]) -> int:
+        """
+        Birden fazla görev ekler (non-blocking)
+        
+        Queue dolduğunda durur; kalan görevler eklenmez. Sayaçlar
+        batch başına bir kez güncellenir.
+        
+        Args:
+            items: Görevler (Task objeleri)
+        
+        Returns:
+            int: Eklenen görev sayısı (baştan itibaren)
+        """
+        added = 0
+        put_nowait = self._queue.put_nowait
+        for item in items:
+            try:
+                put_nowait(item)
+            except queue.Full:
+                self._total_dropped.increment()
+                break
+            added += 1
+        
+        self._total_put.add(added)
+        return added
+
+    def get(self, timeout: Optional[float] = None) -> Optional[Any]:
         """
         Görev alır
         
@@ -69,7 +95,7 @@ class InputQueue:
             timeout: Maksimum bekleme süresi (saniye). None = non-blocking
         
         Returns:
-            Dict: Görev dict'i veya None (timeout/boş)
+            Task: Görev veya None (timeout/boş)
         """
         try:
             if timeout is None:
@@ -79,56 +105,68 @@ class InputQueue:
         except queue.Empty:
             return None  # Queue boş veya timeout
 
-    def size(self) -> int:
-        """Queue boyutu"""
+    def get_many(self, max_items: int, timeout: Optional[float] = None) -> List[Any]:
+        """
+        Birden fazla görev alır (batch)
+        
+        İlk görev için timeout kadar bekler, sonra kuyrukta biriken
+        görevleri beklemeden max_items'a kadar toplar.
+        
+        Args:
+            max_items: En fazla alınacak görev sayısı
+            timeout: İlk görev için bekleme süresi (saniye). None = non-blocking
+        
+        Returns:
+            List: Görevler (boş liste = timeout/boş)
+        """
+        items = []
         try:
-            return self._queue.qsize()
-        except:
-            return 0
+            if timeout is None:
+                items.append(self._queue.get_nowait())
+            else:
+                items.append(self._queue.get(timeout=timeout))
+            get_nowait = self._queue.get_nowait
+            while len(items) < max_items:
+                items.append(get_nowait())
+        except queue.Empty:
+            pass
+        return items
+
+    def size(self) -> int:
+        """
+        Queue boyutu
+        
+        queue.Queue'nun deque'sinin uzunluğu doğrudan okunur: len() GIL
+        altında atomik, qsize()/empty()/full() gibi mutex almaz.
+        Her submit'te (watermark kontrolü) çağrıldığı için önemli.
+        """
+        return len(self._items)
     
     def is_empty(self) -> bool:
         """Boş mu?"""
-        return self._queue.empty()
+        return not self._items
     
     def is_full(self) -> bool:
         """Dolu mu?"""
-        return self._queue.full()
+        return 0 < self._maxsize <= len(self._items)
     
     def get_status(self) -> ComponentStatus:
         """Component durumu"""
-        with self._lock:
-            metrics = {
-                "size": self.size(),
-                "maxsize": self._maxsize,
-                "fullness": self.size() / self._maxsize if self._maxsize > 0 else 0.0,
-                "total_put": self._total_put,
-                "total_dropped": self._total_dropped,
-            }
+        # Lock'suz snapshot: Alanlar arası küçük kayma sağlık raporu için önemsiz
+        size = self.size()
+        total_dropped = self._total_dropped.value
+        metrics = {
+            "size": size,
+            "maxsize": self._maxsize,
+            "fullness": size / self._maxsize if self._maxsize > 0 else 0.0,
+            "total_put": self._total_put.value,
+            "total_dropped": total_dropped,
+        }
         
-        health = "healthy" if self._total_dropped < 100 else "unhealthy"
+        health = "healthy" if total_dropped < 100 else "unhealthy"
         
         return ComponentStatus(
             name="input_queue",
             health=health,
             metrics=metrics
         )
-
-    def __getstate__(self):
-        """Pickle için state - lock'ları hariç tut"""
-        return {
-            '_queue': self._queue,
-            '_maxsize': self._maxsize,
-            '_total_put': self._total_put,
-            '_total_dropped': self._total_dropped,
-            '_created_at': self._created_at,
-        }
-    
-    def __setstate__(self, state):
-        """Pickle'dan restore et"""
-        from threading import Lock
-        self._queue = state['_queue']
-        self._maxsize = state['_maxsize']
-        self._total_put = state['_total_put']
-        self._total_dropped = state['_total_dropped']
-        self._created_at = state['_created_at']
-        self._lock = Lock()  # Yeni lock oluştur
\ No newline at end of file
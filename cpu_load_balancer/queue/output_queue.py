@@ -6,17 +6,18 @@ Multiprocessing.Queue kullanır ve status takibi sağlar.
 
 Kullanım:
     queue = OutputQueue(maxsize=10000)
-    queue.put(result_dict)
+    queue.put(result.to_tuple())
     result = queue.get(timeout=1.0)
 """
 
 import multiprocessing
 import queue
-from typing import Any, Dict, Optional
-from threading import Lock
+from collections import deque
+from typing import Any, List, Optional
 from datetime import datetime
 
 from ..status import ComponentStatus
+from .counter import AtomicCounter
 
 
 class OutputQueue:
@@ -28,39 +29,116 @@ class OutputQueue:
     Özellikler:
     - Non-blocking put: Queue doluysa False döner
     - Blocking get: Timeout ile sonuç alır
+    - Toplu put: put_many ile birden fazla sonuç tek mesajda gönderilir,
+      get/get_many tarafında tek tek açılır
     - Status takibi: Queue boyutu, toplam eklenen/alınan sonuç sayısı
     """
     
-    def __init__(self, maxsize: int = 10000):
-        self._queue = multiprocessing.Queue(maxsize=maxsize)
+    def __init__(self, maxsize: int = 10000, ctx: Optional[Any] = None):
+        # ctx: Worker process'leri ile aynı multiprocessing context'i olmalı
+        ctx = ctx or multiprocessing.get_context()
+        self._queue = ctx.Queue(maxsize=maxsize)
         self._maxsize = maxsize
-        self._total_put = 0
-        self._total_get = 0
-        self._lock = Lock()
+        # Lock'suz sayaçlar: put/get sıcak yolunda lock alınmaz
+        self._total_put = AtomicCounter()
+        self._total_get = AtomicCounter()
         self._created_at = datetime.now()
+        # Alınan toplu mesajlardan henüz dönülmemiş sonuçlar (sadece okuyan tarafta)
+        self._pending = deque()
     
-    def put(self, item: Dict[str, Any]) -> bool:
+    def put(self, item: Any) -> bool:
         """Sonuç ekle (non-blocking)"""
         try:
             self._queue.put_nowait(item)
-            with self._lock:
-                self._total_put += 1
+            self._total_put.increment()
             return True
         except queue.Full:
             return False
     
-    def get(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+    def put_many(self, items: List[Any]) -> bool:
+        """
+        Birden fazla sonucu tek mesajda ekle (non-blocking)
+        
+        Sonuç başına ayrı pickle ve pipe yazımı yerine liste bir kez gönderilir.
+        
+        Args:
+            items: Sonuçlar (Result.to_tuple() çıktıları)
+        
+        Returns:
+            bool: Queue doluysa False (batch eklenmez)
+        """
+        try:
+            self._queue.put_nowait(items)
+            self._total_put.add(len(items))
+            return True
+        except queue.Full:
+            return False
+    
+    def get(self, timeout: Optional[float] = None) -> Optional[Any]:
         """Sonuç al"""
+        if self._pending:
+            self._total_get.increment()
+            return self._pending.popleft()
         try:
             if timeout is None:
-                return self._queue.get_nowait()
+                item = self._queue.get_nowait()
             else:
                 item = self._queue.get(timeout=timeout)
-                with self._lock:
-                    self._total_get += 1
-                return item
         except queue.Empty:
             return None
+        
+        if type(item) is list:
+            # Toplu mesaj: İlki döner, kalanlar sonraki get'lere bekletilir
+            self._pending.extend(item)
+            item = self._pending.popleft()
+        self._total_get.increment()
+        return item
+    
+    def get_many(self, max_items: int, timeout: Optional[float] = None) -> List[Any]:
+        """
+        Birden fazla sonuç al (batch)
+        
+        İlk sonuç için timeout kadar bekler, sonra kuyrukta biriken
+        sonuçları beklemeden max_items'a kadar toplar. Sayaç batch
+        başına bir kez güncellenir.
+        
+        Args:
+            max_items: En fazla alınacak sonuç sayısı
+            timeout: İlk sonuç için bekleme süresi (saniye). None = non-blocking
+        
+        Returns:
+            List: Sonuçlar (Result.to_tuple() çıktıları, boş liste = timeout/boş)
+        """
+        items = []
+        pending = self._pending
+        while pending and len(items) < max_items:
+            items.append(pending.popleft())
+        try:
+            if not items:
+                if timeout is None:
+                    self._add_item(items, self._queue.get_nowait())
+                else:
+                    self._add_item(items, self._queue.get(timeout=timeout))
+            while len(items) < max_items:
+                self._add_item(items, self._queue.get_nowait())
+        except queue.Empty:
+            pass
+        
+        # max_items'ı aşan toplu mesaj sonuçları sonraki çağrıya kalır
+        if len(items) > max_items:
+            pending.extend(items[max_items:])
+            del items[max_items:]
+        
+        self._total_get.add(len(items))
+        return items
+    
+    @staticmethod
+    def _add_item(items: List[Any], item: Any):
+        """Kuyruktan gelen mesajı ekler (toplu mesaj açılır)"""
+        if type(item) is list:
+            items.extend(item)
+        else:
+            items.append(item)
     
     def size(self) -> int:
         """Queue boyutu"""
@@ -71,13 +149,12 @@ class OutputQueue:
     
     def get_status(self) -> ComponentStatus:
         """Component durumu"""
-        with self._lock:
-            metrics = {
-                "size": self.size(),
-                "maxsize": self._maxsize,
-                "total_put": self._total_put,
-                "total_get": self._total_get,
-            }
+        metrics = {
+            "size": self.size(),
+            "maxsize": self._maxsize,
+            "total_put": self._total_put.value,
+            "total_get": self._total_get.value,
+        }
         
         health = "healthy"
         
@@ -88,21 +165,20 @@ class OutputQueue:
         )
     
     def __getstate__(self):
-        """Pickle için state - lock'ları hariç tut"""
+        """Pickle için state - sayaçlar değer olarak taşınır"""
         return {
             '_queue': self._queue,
             '_maxsize': self._maxsize,
-            '_total_put': self._total_put,
-            '_total_get': self._total_get,
+            '_total_put': self._total_put.value,
+            '_total_get': self._total_get.value,
             '_created_at': self._created_at,
         }
     
     def __setstate__(self, state):
         """Pickle'dan restore et"""
-        from threading import Lock
         self._queue = state['_queue']
         self._maxsize = state['_maxsize']
-        self._total_put = state['_total_put']
-        self._total_get = state['_total_get']
+        self._total_put = AtomicCounter(state['_total_put'])
+        self._total_get = AtomicCounter(state['_total_get'])
         self._created_at = state['_created_at']
-        self._lock = Lock()  # Yeni lock oluştur
\ No newline at end of file
+        self._pending = deque()
\ No newline at end of file
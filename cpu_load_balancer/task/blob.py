@@ -0,0 +1,102 @@
+"""
+Shared Memory Blob Modülü
+
+Büyük binary parametreler (dosya içeriği, frame, ndarray buffer'ı) queue
+üzerinden pickle edilmek yerine shared memory'ye yazılır. Queue'dan sadece
+blok adı ve boyutu geçer; worker bloğu map edip memoryview olarak okur.
+
+Kullanım:
+    shm = task.attach_blob("frame", frame_bytes)
+    engine.submit_task(task)
+    result = engine.get_result(task.id, timeout=10)
+    shm.close()
+    shm.unlink()  # Blok oluşturana aittir, sonuç alındıktan sonra serbest bırakılır
+"""
+
+import os
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Callable, Dict
+
+# params içinde blob parametre adlarının listesi (ayrılmış anahtar)
+# Worker'da tek 'in' kontrolü yeterli: blob yoksa params'a dokunulmaz
+BLOB_KEY = "__shm__"
+
+
+def attach_blob(params: Dict[str, Any], name: str, data) -> shared_memory.SharedMemory:
+    """
+    Veriyi shared memory bloğuna kopyalar ve params'a referansını ekler
+
+    Args:
+        params: Görev parametreleri (yerinde güncellenir)
+        name: Script'te kullanılacak parametre adı
+        data: bytes, bytearray, memoryview veya buffer protokolü destekleyen obje
+
+    Returns:
+        SharedMemory: Blok handle'ı (close/unlink sorumluluğu çağırandadır)
+    """
+    if name == BLOB_KEY:
+        raise ValueError(f"'{BLOB_KEY}' ayrılmış parametre adı")
+
+    view = memoryview(data).cast("B")
+    size = view.nbytes
+    # Boyutu 0 olan blok oluşturulamaz
+    shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    shm.buf[:size] = view
+
+    params[name] = {BLOB_KEY: shm.name, "size": size}
+    names = params.setdefault(BLOB_KEY, [])
+    if name not in names:
+        names.append(name)
+    return shm
+
+
+def share_resource_tracker():
+    """
+    Resource tracker'ı worker'lar başlamadan önce çalıştırır
+
+    Worker'lar tracker'ı engine process'inden devralır; bloğa bağlanan
+    worker ayrı bir tracker başlatmaz. Aksi halde (fork) worker kapanırken
+    kendi tracker'ı bloğu "leaked shared_memory" diye silmeye çalışır.
+    """
+    if os.name == "posix":
+        resource_tracker.ensure_running()
+
+
+class BlobMapper:
+    """
+    Blob Mapper - Worker tarafında shared memory bloklarını açar
+
+    Bloklar görev süresince açık tutulur ve görev bitince kapatılır:
+    Worker process'i görevler arasında handle (fd + mmap) biriktirmez.
+    Script memoryview'ı görevden sonra da kullanacaksa kopyalamalıdır.
+    """
+
+    def call(self, func: Callable, params: Dict[str, Any], context: Any) -> Any:
+        """
+        Blob referanslarını memoryview'larla değiştirip func(params, context) çağırır
+
+        Orijinal params değiştirilmez; ayrılmış anahtar çıkarılmış bir
+        kopya geçirilir. func dönünce (veya hata fırlatınca) view'lar
+        bırakılır ve bloklar kapatılır.
+        """
+        resolved = dict(params)
+        blocks = []
+        views = []
+        try:
+            for name in resolved.pop(BLOB_KEY, ()):
+                ref = resolved[name]
+                shm = shared_memory.SharedMemory(name=ref[BLOB_KEY])
+                blocks.append(shm)
+                view = shm.buf[:ref["size"]]
+                views.append(view)
+                resolved[name] = view
+            return func(resolved, context)
+        finally:
+            for view in views:
+                view.release()
+            for shm in blocks:
+                try:
+                    shm.close()
+                except BufferError:
+                    # Script bloktan türetilmiş bir view'ı hâlâ tutuyor; GC'de kapanır
+                    pass
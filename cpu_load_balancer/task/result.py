@@ -11,14 +11,39 @@ Kullanım:
 """
 
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional, Tuple
+import time
 import uuid
 
 from ..core.enums import TaskType, TaskStatus
+from .task import DATACLASS_SLOTS
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+# from_dict'te sonuç başına iki parse: Attribute araması bir kez yapılır
+_fromiso = datetime.fromisoformat
+# to_dict status string'i: Enum sınıf attribute'u + karşılaştırma yerine tek dict araması
+_STATUS_STR = {TaskStatus.COMPLETED: "SUCCESS"}
 
-@dataclass
+
+def _datetime_to_ns(value: Optional[datetime]) -> Optional[int]:
+    """datetime -> epoch nanosaniye (timezone'suz değer UTC kabul edilir)"""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - _EPOCH) // _MICROSECOND * 1000
+
+
+def _ns_to_datetime(value: Optional[int]) -> Optional[datetime]:
+    """Epoch nanosaniye -> UTC datetime"""
+    if value is None:
+        return None
+    return _EPOCH + timedelta(microseconds=value // 1000)
+
+
+@dataclass(init=False, **DATACLASS_SLOTS)
 class Result:
     """
     Görev sonucu
@@ -30,16 +55,62 @@ class Result:
     - Error: Başarısız durumda hata mesajı
     - Zaman bilgileri: Başlangıç ve bitiş zamanı
     
-    Sonuçlar queue'ya gönderilmeden önce dict'e dönüştürülür.
+    Sonuçlar queue'ya gönderilmeden önce tuple'a dönüştürülür.
+    
+    Zamanlar epoch nanosaniye (time.time_ns()) olarak saklanır; datetime
+    sadece started_at/completed_at okunduğunda veya to_dict()'te üretilir.
+    Sıcak yolda (execute -> to_tuple) hiç datetime oluşturulmaz.
     """
     task_id: str 
     status: TaskStatus
     data: Any = None
     error: Optional[str] = None
     error_details: Optional[Dict[str, Any]] = None
-    started_at: Optional[datetime] = None
-    completed_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    started_ns: Optional[int] = None
+    completed_ns: Optional[int] = field(default_factory=time.time_ns)
+    
+    def __init__(
+        self,
+        task_id: str,
+        status: TaskStatus,
+        data: Any = None,
+        error: Optional[str] = None,
+        error_details: Optional[Dict[str, Any]] = None,
+        started_at: Optional[datetime] = None,
+        completed_at: Optional[datetime] = None,
+        started_ns: Optional[int] = None,
+        completed_ns: Optional[int] = None,
+    ):
+        self.task_id = task_id
+        self.status = status
+        self.data = data
+        self.error = error
+        self.error_details = error_details
+        self.started_ns = started_ns if started_ns is not None else _datetime_to_ns(started_at)
+        if completed_ns is None:
+            completed_ns = _datetime_to_ns(completed_at) if completed_at is not None else time.time_ns()
+        self.completed_ns = completed_ns
+    
+    @property
+    def started_at(self) -> Optional[datetime]:
+        """Başlangıç zamanı (UTC datetime, okunurken üretilir)"""
+        return _ns_to_datetime(self.started_ns)
+    
+    @started_at.setter
+    def started_at(self, value: Optional[datetime]):
+        self.started_ns = _datetime_to_ns(value)
+    
+    @property
+    def completed_at(self) -> Optional[datetime]:
+        """Bitiş zamanı (UTC datetime, okunurken üretilir)"""
+        return _ns_to_datetime(self.completed_ns)
+    
+    @completed_at.setter
+    def completed_at(self, value: Optional[datetime]):
+        self.completed_ns = _datetime_to_ns(value)
 
+    # status sonradan değişebilir (from_dict/from_tuple): Bayrak saklanmaz, okunurken
+    # hesaplanır. Enum üyeleri tekil: == yerine kimlik karşılaştırması
     @property
     def is_success(self) -> bool:
         """
@@ -48,7 +119,17 @@ class Result:
         Returns:
             bool: True ise başarılı, False ise başarısız
         """
-        return self.status == TaskStatus.COMPLETED
+        return self.status is TaskStatus.COMPLETED
+    
+    @property
+    def is_failed(self) -> bool:
+        """
+        Başarısız mı?
+        
+        Returns:
+            bool: True ise başarısız
+        """
+        return self.status is TaskStatus.FAILED
 
     @property
     def duration(self) -> Optional[float]:
@@ -58,23 +139,18 @@ class Result:
         Returns:
             float: Başlangıç ve bitiş zamanı varsa süre, yoksa None
         """
-        if self.started_at and self.completed_at:
-            # Timezone-aware datetime'ları karşılaştırmak için normalize et
-            from datetime import timezone
-            started = self.started_at
-            completed = self.completed_at
-            
-            # Eğer biri timezone-aware diğeri değilse, normalize et
-            if started.tzinfo is None and completed.tzinfo is not None:
-                started = started.replace(tzinfo=timezone.utc)
-            elif started.tzinfo is not None and completed.tzinfo is None:
-                completed = completed.replace(tzinfo=timezone.utc)
-            
-            return (completed - started).total_seconds()
+        if self.started_ns is not None and self.completed_ns is not None:
+            return (self.completed_ns - self.started_ns) / 1e9
         return None
     
     @classmethod
-    def success(cls, task_id: str, data: Any, started_at: Optional[datetime] = None) -> "Result":
+    def success(
+        cls,
+        task_id: str,
+        data: Any,
+        started_at: Optional[datetime] = None,
+        started_ns: Optional[int] = None
+    ) -> "Result":
         """
         Başarılı sonuç oluşturur
         
@@ -82,6 +158,7 @@ class Result:
             task_id: Görev ID'si
             data: Sonuç verisi
             started_at: Başlangıç zamanı (opsiyonel)
+            started_ns: Başlangıç zamanı, time.time_ns() (opsiyonel, hızlı yol)
         
         Returns:
             Result: Başarılı sonuç objesi
@@ -91,10 +168,17 @@ class Result:
             status=TaskStatus.COMPLETED,
             data=data,
             started_at=started_at,
+            started_ns=started_ns,
         )
     
     @classmethod
-    def failed(cls, task_id: str, error: str, started_at: Optional[datetime] = None) -> "Result":
+    def failed(
+        cls,
+        task_id: str,
+        error: str,
+        started_at: Optional[datetime] = None,
+        started_ns: Optional[int] = None
+    ) -> "Result":
         """
         Başarısız sonuç oluşturur
         
@@ -102,6 +186,7 @@ class Result:
             task_id: Görev ID'si
             error: Hata mesajı
             started_at: Başlangıç zamanı (opsiyonel)
+            started_ns: Başlangıç zamanı, time.time_ns() (opsiyonel, hızlı yol)
         
         Returns:
             Result: Başarısız sonuç objesi
@@ -111,37 +196,62 @@ class Result:
             status=TaskStatus.FAILED,
             error=error,
             started_at=started_at,
+            started_ns=started_ns,
         )
     
     def to_dict(self) -> Dict[str, Any]:
         """Dict'e dönüştür (queue için)"""
         return {
             "task_id": self.task_id,
-            "status": "SUCCESS" if self.is_success else "FAILED",
+            "status": _STATUS_STR.get(self.status, "FAILED"),
             "data": self.data,
             "error": self.error,
-            "started_at": self.started_at.isoformat() if self.started_at else None,
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "started_at": self.started_at.isoformat() if self.started_ns is not None else None,
+            "completed_at": self.completed_at.isoformat() if self.completed_ns is not None else None,
         }
     
+    def to_tuple(self) -> Tuple:
+        """
+        Kompakt tuple'a dönüştürür (process'ler arası queue için)
+        
+        Dict'e göre pickle çıktısı yarı boyutta ve kodlaması ~2x hızlı:
+        Alan adları her sonuçla taşınmaz, zamanlar ISO string yerine
+        epoch nanosaniye (int) olarak gider.
+        
+        Sıra: (task_id, başarılı mı, data, error, started_ns, completed_ns)
+        """
+        return (
+            self.task_id,
+            self.status is TaskStatus.COMPLETED,
+            self.data,
+            self.error,
+            self.started_ns,
+            self.completed_ns,
+        )
+    
+    @classmethod
+    def from_tuple(cls, data: Tuple) -> "Result":
+        """to_tuple() çıktısından oluştur"""
+        result = cls.__new__(cls)
+        (result.task_id, success, result.data, result.error,
+         result.started_ns, result.completed_ns) = data
+        result.status = TaskStatus.COMPLETED if success else TaskStatus.FAILED
+        result.error_details = None
+        return result
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Result":
         """Dict'ten oluştur"""
-        status_str = data.get("status", "FAILED")
-        status = TaskStatus.COMPLETED if status_str == "SUCCESS" else TaskStatus.FAILED
-        
-        started_at = None
-        completed_at = None
-        if data.get("started_at"):
-            started_at = datetime.fromisoformat(data["started_at"])
-        if data.get("completed_at"):
-            completed_at = datetime.fromisoformat(data["completed_at"])
+        # Güvenilir iç yol (queue'dan gelen dict): __init__ ve default_factory'leri atla
+        result = cls.__new__(cls)
+        result.task_id = data.get("task_id", "unknown")
+        result.status = TaskStatus.COMPLETED if data.get("status") == "SUCCESS" else TaskStatus.FAILED
+        result.data = data.get("data")
+        result.error = data.get("error")
+        result.error_details = None
         
-        return cls(
-            task_id=data.get("task_id", "unknown"),
-            status=status,
-            data=data.get("data"),
-            error=data.get("error"),
-            started_at=started_at,
-            completed_at=completed_at
-        )
\ No newline at end of file
+        started_at = data.get("started_at")
+        completed_at = data.get("completed_at")
+        result.started_ns = _datetime_to_ns(_fromiso(started_at)) if started_at else None
+        result.completed_ns = _datetime_to_ns(_fromiso(completed_at)) if completed_at else None
+        return result
\ No newline at end of file
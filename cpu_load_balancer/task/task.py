@@ -14,13 +14,56 @@ Kullanım:
 
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-import uuid
-from typing import Any, Dict, Optional, List
+from functools import partial
+from itertools import count
+import os
+import secrets
+import sys
+from typing import Any, Dict, Optional, List, Tuple
 
 from ..core.enums import TaskType, TaskStatus
 
 
-@dataclass
+# Python 3.10+: slots=True ile instance başına __dict__ tutulmaz
+# (binlerce pending görevde bellek ve attribute erişimi kazancı)
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# from_dict her görevde çağrılır: timezone.utc attribute araması bir kez yapılır
+_UTC = timezone.utc
+
+# TaskType(value) Enum metaclass üzerinden ~10x yavaş; worker'da her görevde çözülür
+_TASK_TYPES = {task_type.value: task_type for task_type in TaskType}
+# Ters yön: Enum .value property'si dict aramasından yavaş (to_dict/to_tuple)
+_TASK_TYPE_VALUES = {task_type: task_type.value for task_type in TaskType}
+
+# Görev ID'si: Sayaç + process'e özgü rastgele önek (uuid4'ün görev başına
+# os.urandom + 36 karakterlik formatlaması yerine). next(count) GIL altında atomik
+_id_counter = count()
+_id_prefix = secrets.token_hex(6)
+
+
+def _reset_task_ids():
+    """Fork sonrası child kendi önekini alır: Parent ile aynı ID'ler üretilmez"""
+    global _id_counter, _id_prefix
+    _id_counter = count()
+    _id_prefix = secrets.token_hex(6)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_task_ids)
+
+
+def new_task_id() -> str:
+    """
+    Benzersiz görev ID'si üretir
+    
+    Format: 8+ hex sayaç + 12 hex process öneki (örn: "0000002a3f9c1be07d42").
+    İlk 8 karakter sayaçtır: Kısaltılmış gösterimde görevler ayırt edilir.
+    """
+    return f"{next(_id_counter):08x}{_id_prefix}"
+
+
+@dataclass(**DATACLASS_SLOTS)
 class Task:
     """
     Görev tanımı
@@ -35,8 +78,9 @@ class Task:
     Görevler queue'ya gönderilmeden önce dict'e dönüştürülür.
     """
     # Base fields
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    id: str = field(default_factory=new_task_id)
+    # partial: Her görevde lambda frame'i ve global aramalar olmadan C çağrısı
+    created_at: datetime = field(default_factory=partial(datetime.now, _UTC))
     # Task type and status
     task_type: TaskType = TaskType.CPU_BOUND
     status: TaskStatus = TaskStatus.PENDING
@@ -47,6 +91,8 @@ class Task:
     retry_count: int = 0
     # Workflow dependencies
     dependencies: List[str] = field(default_factory=list)  # Beklenen task ID'leri
+    # Aynı script + params için sonuç cache'lenebilir mi? (yan etkisiz script'ler)
+    memoizable: bool = False
 
     @classmethod
     def create(
@@ -55,7 +101,8 @@ class Task:
         params: Optional[Dict[str, Any]] = None,
         task_type: TaskType = TaskType.IO_BOUND,
         max_retries: int = 3,
-        dependencies: Optional[List[str]] = None
+        dependencies: Optional[List[str]] = None,
+        memoizable: bool = False
     ) -> "Task":
         """
         Factory metodu - görev oluşturur
@@ -65,6 +112,8 @@ class Task:
             params: Script'e geçirilecek parametreler (dict)
             task_type: Görev tipi (CPU_BOUND veya IO_BOUND)
             max_retries: Maksimum deneme sayısı
+            memoizable: True ise aynı params ile tekrar çalıştırılmaz,
+                        önceki sonuç kullanılır (sadece yan etkisiz script'ler için)
         
         Returns:
             Task: Yeni görev objesi
@@ -74,9 +123,28 @@ class Task:
             params=params or {},
             task_type=task_type,
             max_retries=max_retries,
-            dependencies=dependencies or []
+            dependencies=dependencies or [],
+            memoizable=memoizable
         )
     
+    def attach_blob(self, name: str, data):
+        """
+        Büyük binary parametreyi shared memory üzerinden geçirir
+        
+        Veri pickle edilip queue'dan geçmez; params'a sadece blok adı ve
+        boyutu yazılır. Script parametreyi memoryview olarak alır.
+        
+        Args:
+            name: Parametre adı
+            data: bytes, bytearray veya buffer protokolü destekleyen obje (örn: ndarray)
+        
+        Returns:
+            SharedMemory: Blok handle'ı - sonuç alındıktan sonra close() ve unlink() çağrılmalı
+        """
+        # multiprocessing.shared_memory sadece blob kullanılınca yüklenir
+        from .blob import attach_blob
+        return attach_blob(self.params, name, data)
+    
     def to_dict(self) -> Dict[str, Any]:
         """
         Dict'e dönüştürür (queue için)
@@ -90,11 +158,45 @@ class Task:
             "task_id": self.id,
             "script_path": self.script_path,
             "params": self.params,
-            "task_type": self.task_type.value,
+            "task_type": _TASK_TYPE_VALUES[self.task_type],
             "max_retries": self.max_retries,
             "dependencies": self.dependencies,
+            "memoizable": self.memoizable,
         }
     
+    def to_tuple(self) -> Tuple:
+        """
+        Kompakt tuple'a dönüştürür (worker queue'ları için)
+        
+        Dict'e göre alan adları her görevle pickle edilmez; mesaj daha
+        küçük ve kodlaması daha hızlıdır.
+        
+        Sıra: (task_id, script_path, params, task_type, max_retries,
+               dependencies, memoizable)
+        """
+        return (
+            self.id,
+            self.script_path,
+            self.params,
+            _TASK_TYPE_VALUES[self.task_type],
+            self.max_retries,
+            self.dependencies,
+            self.memoizable,
+        )
+    
+    @classmethod
+    def from_tuple(cls, data: Tuple) -> "Task":
+        """to_tuple() çıktısından Task objesi oluşturur"""
+        task = cls.__new__(cls)
+        (task.id, task.script_path, task.params, task_type,
+         task.max_retries, task.dependencies, task.memoizable) = data
+        task_type = _TASK_TYPES.get(task_type)
+        task.task_type = task_type if task_type is not None else TaskType(data[3])
+        task.created_at = datetime.now(_UTC)
+        task.status = TaskStatus.PENDING
+        task.retry_count = 0
+        return task
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Task":
         """
@@ -108,12 +210,19 @@ class Task:
         Returns:
             Task: Yeni Task objesi
         """
-        task_type = TaskType(data.get("task_type", "io_bound"))
-        return cls(
-            id=data.get("task_id", str(uuid.uuid4())),
-            script_path=data.get("script_path", ""),
-            params=data.get("params", {}),
-            task_type=task_type,
-            max_retries=data.get("max_retries", 3),
-            dependencies=data.get("dependencies", [])
-        )
\ No newline at end of file
+        # Güvenilir iç yol: __init__ ve default_factory'leri atla, alanları doğrudan ata
+        task = cls.__new__(cls)
+        task_id = data.get("task_id")
+        task.id = task_id if task_id is not None else new_task_id()
+        task.created_at = datetime.now(_UTC)
+        task_type = data.get("task_type", "io_bound")
+        resolved = _TASK_TYPES.get(task_type)
+        task.task_type = resolved if resolved is not None else TaskType(task_type)
+        task.status = TaskStatus.PENDING
+        task.params = data.get("params", {})
+        task.script_path = data.get("script_path", "")
+        task.max_retries = data.get("max_retries", 3)
+        task.retry_count = 0
+        task.dependencies = data.get("dependencies", [])
+        task.memoizable = data.get("memoizable", False)
+        return task
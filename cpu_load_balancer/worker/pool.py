@@ -8,17 +8,23 @@ Kullanım:
     pool = ProcessPool(output_queue, cpu_bound_count=1, io_bound_count=4)
     pool.start()
     pool.submit_task(task, TaskType.IO_BOUND)
+    pool.submit_tasks(tasks, TaskType.IO_BOUND)
     pool.shutdown()
 """
 
+import glob
+import heapq
 import multiprocessing
-from typing import List, Optional, Callable, Any
+import os
+from typing import Dict, List, Optional, Callable, Any
 from threading import Lock, Thread, Event
+from concurrent.futures import ThreadPoolExecutor
 import time
 
 from ..core.enums import TaskType, ProcessMetric
 from ..status import ComponentStatus
-from .process import WorkerProcess
+from ..task.task import Task
+from .process import WorkerProcess, OP_EXECUTE_TASK, OP_EXECUTE_BATCH, OP_SHUTDOWN
 
 
 class ProcessPool:
@@ -33,6 +39,17 @@ class ProcessPool:
     - Status takibi: Worker sayıları ve aktif thread sayıları
     """
     
+    # Worker yük skorları bu süre (saniye) boyunca yeniden okunmaz;
+    # arada dağıtılan görevler cache'teki skora eklenir
+    LOAD_CACHE_TTL = 0.001
+    
+    # Bir worker kuyruğu mesajında en fazla bu kadar görev gider
+    MAX_MESSAGE_BATCH = 32
+    
+    # Tembel başlatma: En az yüklü IO worker'ın skoru thread limitinin bu
+    # oranını geçince (tüm açık worker'lar dolu) yeni IO worker açılır
+    IO_SPAWN_LOAD = 0.8
+    
     def __init__(
         self,
         output_queue: Any,  # OutputQueue
@@ -40,17 +57,29 @@ class ProcessPool:
         io_bound_count: Optional[int] = None,
         cpu_task_limit: int = 1,
         io_task_limit: int = 20,
-        executor_func: Optional[Callable] = None
+        executor_func: Optional[Callable] = None,
+        ctx: Optional[Any] = None,
+        pin_offset: int = 0,
+        io_warm_count: Optional[int] = None,
+        cpu_pin_cores: Optional[List[int]] = None
     ):
         if io_bound_count is None:
             io_bound_count = max(1, multiprocessing.cpu_count() - 1)
         
+        # IO worker üst sınırı; io_warm_count verilirse start() sadece o
+        # kadarını açar, gerisi yük geldikçe submit_tasks'ta eklenir
+        self._io_target_count = io_bound_count
+        if io_warm_count is not None:
+            io_bound_count = max(1, min(io_warm_count, io_bound_count))
+        
         self._output_queue = output_queue
         self._cpu_bound_count = cpu_bound_count
         self._io_bound_count = io_bound_count
         self._cpu_task_limit = cpu_task_limit
         self._io_task_limit = io_task_limit
         self._executor_func = executor_func
+        # multiprocessing context: Queue, Value ve Process'ler aynı context'ten oluşturulmalı
+        self._ctx = ctx or multiprocessing.get_context()
         
         # Sharded Queues (Her worker için ayrı kuyruk)
         self._cpu_queues = []
@@ -65,22 +94,45 @@ class ProcessPool:
         
         # Worker ID counter (Unique ID'ler için)
         self._worker_counter = 0
+        
+        # CPU affinity için kullanılabilir çekirdekler: Bir kez hesaplanır
+        # pin_offset: Aynı makinedeki birden fazla pool aynı çekirdeklere sabitlenmesin
+        self._available_cpus = self._usable_cpus(pin_offset)
+        # cpu_pin_cores: CPU-bound worker'lar sadece bu çekirdeklere, IO-bound
+        # worker'lar kalanlara sabitlenir (kullanılamayan çekirdekler atlanır)
+        self._cpu_pin_cores = None
+        if cpu_pin_cores:
+            usable = set(self._available_cpus)
+            self._cpu_pin_cores = [cpu for cpu in cpu_pin_cores if cpu in usable] or None
+        if self._cpu_pin_cores is not None:
+            reserved = set(self._cpu_pin_cores)
+            self._cpu_worker_cpus = self._cpu_pin_cores
+            self._io_worker_cpus = [cpu for cpu in self._available_cpus if cpu not in reserved] or self._available_cpus
+        else:
+            self._cpu_worker_cpus = self._io_worker_cpus = self._available_cpus
+        
+        # Çekirdek -> NUMA düğümü (tek düğümlü sistemlerde boş)
+        self._cpu_nodes = self._numa_nodes()
+        # {task_type: {düğüm: [kuyruk, ...]}} - Worker'lar önce kendi düğümünden çalar
+        self._node_queues = {TaskType.CPU_BOUND: {}, TaskType.IO_BOUND: {}}
+        
+        # {task_type: (okuma zamanı, [(skor, index), ...] heap)} - submit başına W process'ler arası okuma yerine
+        self._load_cache = {}
     
     def start(self) -> bool:
         """Pool'u başlat"""
         if self._started:
             return True
         
+        # Context attribute'u döngülerde tekrar tekrar aranmaz
+        make_queue = self._ctx.Queue
+        
         # CPU-bound worker'ları oluştur
         # Kuyrukları oluştur
-        self._cpu_queues = [multiprocessing.Queue() for _ in range(self._cpu_bound_count)]
+        self._cpu_queues = [make_queue() for _ in range(self._cpu_bound_count)]
+        
+        available_cpus = self._cpu_worker_cpus
         
-        # CPU affinity için mevcut çekirdekleri al
-        try:
-            available_cpus = list(range(multiprocessing.cpu_count()))
-        except:
-            available_cpus = []
-            
         for i in range(self._cpu_bound_count):
             # Worker'a CPU ata (Round-robin)
             cpu_id = available_cpus[i % len(available_cpus)] if available_cpus else None
@@ -98,16 +150,17 @@ class ProcessPool:
                 nice_level=0,
                 # Work Stealing Parametreleri
                 my_queue=self._cpu_queues[i],
-                all_queues=self._cpu_queues # Tüm kuyrukları bilmeli ki çalabilsin
+                all_queues=self._cpu_queues, # Tüm kuyrukları bilmeli ki çalabilsin
+                local_queues=self._register_node_queue(TaskType.CPU_BOUND, cpu_id, self._cpu_queues[i]),
+                ctx=self._ctx
             )
-            worker.start()
             self._cpu_workers.append(worker)
         
         # IO-bound worker'ları oluştur
-        self._io_queues = [multiprocessing.Queue() for _ in range(self._io_bound_count)]
+        self._io_queues = [make_queue() for _ in range(self._io_bound_count)]
         
         for i in range(self._io_bound_count):
-            cpu_id = available_cpus[(i + self._cpu_bound_count) % len(available_cpus)] if available_cpus else None
+            cpu_id = self._io_cpu_id(i)
             
             worker_id = f"io-{self._worker_counter}"
             self._worker_counter += 1
@@ -121,119 +174,195 @@ class ProcessPool:
                 cpu_id=cpu_id,
                 nice_level=5,
                 my_queue=self._io_queues[i],
-                all_queues=self._io_queues
+                all_queues=self._io_queues,
+                local_queues=self._register_node_queue(TaskType.IO_BOUND, cpu_id, self._io_queues[i]),
+                ctx=self._ctx
             )
-            worker.start()
             self._io_workers.append(worker)
         
+        # Process'leri paralel başlat: Her start() çağrısı (özellikle spawn'da)
+        # child için pickle + exec bekler, sıralı başlatma engine'i geciktirir
+        # (fork'ta sıralı, bkz. _parallel_start_safe)
+        self._start_workers(self._cpu_workers + self._io_workers)
+        
         self._started = True
         return True
+    
+    def _parallel_start_safe(self) -> bool:
+        """
+        Process'ler thread'lerden paralel başlatılabilir mi?
+        
+        fork'ta paralel start() çok thread'li parent'tan fork eder: Bir
+        thread'in açtığı sentinel pipe'ları diğer child'lara da kalıtılır,
+        join'ler zaman aşımına düşer. Sadece spawn/forkserver'da paralel.
+        """
+        return self._ctx.get_start_method() in ("spawn", "forkserver")
 
-    def submit_task(self, task: Any, task_type: TaskType) -> bool:
-        if not self._started:
-            return False
+    def _start_workers(self, workers: List[WorkerProcess]):
+        """Worker process'lerini başlatır (spawn/forkserver'da paralel)"""
+        if len(workers) <= 1 or not self._parallel_start_safe():
+            for worker in workers:
+                worker.start()
+            return
+        
+        with ThreadPoolExecutor(max_workers=len(workers)) as executor:
+            # list(): start() sırasında oluşan hataları yukarı taşı
+            list(executor.map(lambda w: w.start(), workers))
 
-        workers = (
-            self._cpu_workers
-            if task_type == TaskType.CPU_BOUND
-            else self._io_workers
-        )
+    def _stop_workers(self, workers: List[WorkerProcess]):
+        """Worker process'lerini kapatır (spawn/forkserver'da paralel)"""
+        if len(workers) <= 1 or not self._parallel_start_safe():
+            for worker in workers:
+                worker.shutdown()
+            return
+        
+        with ThreadPoolExecutor(max_workers=len(workers)) as executor:
+            list(executor.map(lambda w: w.shutdown(), workers))
 
-        if not workers:
-            return False
+    def submit_task(self, task: Any, task_type: TaskType) -> bool:
+        """Tek görevi en az yüklü worker'a gönderir"""
+        return self.submit_tasks([task], task_type) == 1
 
-        best_worker_idx = None
-        best_score = float("inf")
+    def submit_tasks(self, tasks: List[Any], task_type: TaskType) -> int:
+        """
+        Aynı tipteki görevleri toplu dağıtır
+        
+        Worker yükleri en fazla LOAD_CACHE_TTL'de bir okunur (process'ler
+        arası Value okumaları görev başına değil). Görevler çağrılar arası
+        korunan skor min-heap'i ile dağıtılır; worker'a eklenen her görev
+        skorunu, kuyruk yükünün skordaki ağırlığı kadar artırır. Aynı
+        worker'a düşen görevler OP_EXECUTE_BATCH mesajlarında toplanır.
+        IO worker'lar tembel başlatıldıysa (io_warm_count), açık worker'ların
+        hepsi dolduğunda dağıtım sırasında yeni worker açılır.
+        
+        Args:
+            tasks: Görevler (Task veya to_tuple() çıktısı)
+            task_type: Görev tipi (hangi worker grubuna gideceği)
+        
+        Returns:
+            int: Dağıtılan görev sayısı
+        """
+        if not self._started or not tasks:
+            return 0
 
-        for i, worker in enumerate(workers):
-            active_threads, process_queue_size, thread_queue_size = worker.active_thread_count()
+        if task_type == TaskType.CPU_BOUND:
+            workers, queues = self._cpu_workers, self._cpu_queues
+            # Kuyruk yükünün skordaki ağırlığı (_worker_score ile aynı)
+            queue_weight = 0.6
+            task_limit = self._cpu_task_limit
+        else:
+            workers, queues = self._io_workers, self._io_queues
+            queue_weight = 1.0
+            task_limit = self._io_task_limit
 
-            metrics = worker.process_metrics
-            cpu_usage = metrics[ProcessMetric.CPU]
+        if not workers:
+            return 0
 
-            # ---- LOAD COMPONENTS ----
-            thread_load = active_threads + thread_queue_size
-            process_load = process_queue_size
-            cpu_norm = cpu_usage / 100.0
+        # Skor heap'i LOAD_CACHE_TTL içinde okunduysa çağrılar arası korunur
+        # Worker sayısı değiştiyse (autoscale) cache geçersiz
+        now = time.monotonic()
+        cached = self._load_cache.get(task_type)
+        if cached is not None and now - cached[0] < self.LOAD_CACHE_TTL and len(cached[1]) == len(workers):
+            heap = cached[1]
+        else:
+            # (skor, index): Eşit skorda düşük index önce (tek görevde eski davranış)
+            heap = [(self._worker_score(worker, task_type), i) for i, worker in enumerate(workers)]
+            heapq.heapify(heap)
+            self._load_cache[task_type] = (now, heap)
 
-            # ---- SCORE ----
-            if task_type == TaskType.CPU_BOUND:
-                # CPU işleri: thread saturation kritik
-                score = (
-                        process_load * 0.6 +
-                        thread_load * 1.2 +
-                        cpu_norm * 0.05
-                )
-            else:
-                # IO işleri: queue doluluğu kritik
-                score = (
-                        process_load * 1.0 +
-                        thread_load * 0.8 +
-                        cpu_norm * 0.02
-                )
+        # Tembel başlatma: En az yüklü IO worker bu skoru geçerse (açık
+        # worker'ların hepsi dolu) io_bound_count'a kadar yeni worker açılır
+        spawn_score = None
+        if task_type != TaskType.CPU_BOUND and len(workers) < self._io_target_count:
+            spawn_score = self.IO_SPAWN_LOAD * task_limit
 
-            if score < best_score:
-                best_score = score
-                best_worker_idx = i
+        # Görev başına O(log W): En az yüklü worker heap'in tepesinde
+        assigned = {}
+        remaining = None
+        for position, task in enumerate(tasks):
+            score, index = heap[0]
+            if spawn_score is not None and score >= spawn_score:
+                if self.add_worker(TaskType.IO_BOUND):
+                    # Worker sayısı değişti: Kalanlar yeni heap ile dağıtılır
+                    remaining = tasks[position:]
+                    break
+                spawn_score = None
+            # isinstance: hasattr'in AttributeError yolu (hazır tuple'larda) yok
+            task_data = task.to_tuple() if isinstance(task, Task) else task
+            assigned.setdefault(index, []).append(task_data)
 
-        if best_worker_idx is None:
-            return False
+            # İyimser hesap: Dağıtılan görev bir sonraki okumaya kadar skorda kalır
+            heapq.heapreplace(heap, (score + queue_weight, index))
 
-        target_queue = (
-            self._cpu_queues[best_worker_idx]
-            if task_type == TaskType.CPU_BOUND
-            else self._io_queues[best_worker_idx]
-        )
+        # Aynı worker'a düşen görevler tek mesajda gider: Pickle ve pipe
+        # yazımı görev başına değil mesaj başına. Mesaj boyu worker'ın
+        # thread limitini aşmaz (fazlası kuyrukta çalınabilir kalır)
+        batch_size = min(task_limit, self.MAX_MESSAGE_BATCH)
+        for index, batch in assigned.items():
+            queue = queues[index]
+            for start in range(0, len(batch), batch_size):
+                chunk = batch[start:start + batch_size]
+                # Mesaj: (komut, veri) - dict anahtarları her görevde pickle edilmez
+                if len(chunk) == 1:
+                    queue.put((OP_EXECUTE_TASK, chunk[0]))
+                else:
+                    queue.put((OP_EXECUTE_BATCH, chunk))
 
-        task_data = task.to_dict() if hasattr(task, "to_dict") else task
+        if remaining:
+            return len(tasks) - len(remaining) + self.submit_tasks(remaining, task_type)
+        return len(tasks)
 
-        target_queue.put({
-            "command": "execute_task",
-            "task": task_data
-        })
+    @staticmethod
+    def _worker_score(worker: WorkerProcess, task_type: TaskType) -> float:
+        """Worker yük skoru (düşük = daha az yüklü)"""
+        active_threads, process_queue_size, thread_queue_size = worker.active_thread_count()
+        cpu_usage = worker.process_metrics[ProcessMetric.CPU]
 
-        return True
+        # ---- LOAD COMPONENTS ----
+        thread_load = active_threads + thread_queue_size
+        process_load = process_queue_size
+        cpu_norm = cpu_usage / 100.0
+
+        # ---- SCORE ----
+        if task_type == TaskType.CPU_BOUND:
+            # CPU işleri: thread saturation kritik
+            return (
+                    process_load * 0.6 +
+                    thread_load * 1.2 +
+                    cpu_norm * 0.05
+            )
+        # IO işleri: queue doluluğu kritik
+        return (
+                process_load * 1.0 +
+                thread_load * 0.8 +
+                cpu_norm * 0.02
+        )
 
     def shutdown(self):
         """Pool'u kapat"""
         self._shutdown_event.set()
         
-        # Tüm worker'ları kapat
-        for worker in self._cpu_workers + self._io_workers:
-            worker.shutdown()
-        
-        # Process'lerin kapanmasını bekle
-        for worker in self._cpu_workers + self._io_workers:
-            if worker._process and worker._process.is_alive():
-                worker._process.join(timeout=5.0)
-                # Hala çalışıyorsa terminate et
-                if worker._process.is_alive():
-                    worker._process.terminate()
-                    worker._process.join(timeout=2.0)
-                    if worker._process.is_alive():
-                        worker._process.kill()
-                        worker._process.join(timeout=1.0)
+        # Tüm worker'ları paralel kapat: Her shutdown() kendi process'ini
+        # join/terminate/kill ile bekler, sıralı kapatma W x timeout sürer
+        # (fork'ta sıralı, bkz. _parallel_start_safe)
+        self._stop_workers(self._cpu_workers + self._io_workers)
         
         self._started = False
     
     def wait_for_shutdown(self, timeout: float = 10.0):
         """Tüm process'lerin kapanmasını bekler"""
-        import time
-        start_time = time.time()
-        
-        while time.time() - start_time < timeout:
-            all_dead = True
-            for worker in self._cpu_workers + self._io_workers:
-                if worker._process and worker._process.is_alive():
-                    all_dead = False
-                    break
-            
-            if all_dead:
-                return True
-            
-            time.sleep(0.1)
+        # Polling yerine join: Process çıkar çıkmaz uyanılır
+        deadline = time.monotonic() + timeout
         
-        return False
+        for worker in self._cpu_workers + self._io_workers:
+            process = worker._process
+            if process is None:
+                continue
+            process.join(timeout=max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                return False
+        
+        return True
     
     def add_worker(self, task_type: TaskType) -> bool:
         """Yeni bir worker ekler (Scale Out)"""
@@ -241,22 +370,16 @@ class ProcessPool:
             if not self._started:
                 return False
                 
-            try:
-                available_cpus = list(range(multiprocessing.cpu_count()))
-            except:
-                available_cpus = []
-            
             worker_id = f"{'cpu' if task_type == TaskType.CPU_BOUND else 'io'}-{self._worker_counter}"
             self._worker_counter += 1
             
             # Yeni kuyruk oluştur
-            new_queue = multiprocessing.Queue()
+            new_queue = self._ctx.Queue()
             
             if task_type == TaskType.CPU_BOUND:
                 self._cpu_queues.append(new_queue)
-                # Yeni worker için CPU seç (Round-robin)
-                idx = len(self._cpu_workers)
-                cpu_id = available_cpus[idx % len(available_cpus)] if available_cpus else None
+                # Yeni worker için boşta olan bir çekirdek seç
+                cpu_id = self._free_cpu_id(self._cpu_worker_cpus)
                 
                 worker = WorkerProcess(
                     worker_id=worker_id,
@@ -267,7 +390,9 @@ class ProcessPool:
                     cpu_id=cpu_id,
                     nice_level=0,
                     my_queue=new_queue,
-                    all_queues=self._cpu_queues
+                    all_queues=self._cpu_queues,
+                    local_queues=self._register_node_queue(TaskType.CPU_BOUND, cpu_id, new_queue),
+                    ctx=self._ctx
                 )
                 worker.start()
                 self._cpu_workers.append(worker)
@@ -275,8 +400,7 @@ class ProcessPool:
                 
             else:
                 self._io_queues.append(new_queue)
-                idx = len(self._io_workers)
-                cpu_id = available_cpus[(idx + self._cpu_bound_count) % len(available_cpus)] if available_cpus else None
+                cpu_id = self._io_cpu_id(len(self._io_workers))
                 
                 worker = WorkerProcess(
                     worker_id=worker_id,
@@ -287,7 +411,9 @@ class ProcessPool:
                     cpu_id=cpu_id,
                     nice_level=5,
                     my_queue=new_queue,
-                    all_queues=self._io_queues
+                    all_queues=self._io_queues,
+                    local_queues=self._register_node_queue(TaskType.IO_BOUND, cpu_id, new_queue),
+                    ctx=self._ctx
                 )
                 worker.start()
                 self._io_workers.append(worker)
@@ -295,6 +421,115 @@ class ProcessPool:
                 
             return True
 
+    @staticmethod
+    def _usable_cpus(pin_offset: int = 0) -> List[int]:
+        """
+        Process'in çalışabildiği çekirdekler (sabitleme sırasıyla)
+        
+        Linux'ta affinity maskesi okunur: taskset ve container cpuset
+        kısıtları dışındaki çekirdeklere worker sabitlenmez. Hyperthread
+        kardeşleri sona alınır: Önce her fiziksel çekirdeğin ilk mantıksal
+        CPU'su gelir, böylece CPU-bound worker'lar ayrı fiziksel
+        çekirdeklere, fazlası (IO-bound) kardeş thread'lere düşer.
+        
+        Args:
+            pin_offset: Her grup bu kadar kaydırılır (çoklu pool/deployment)
+        """
+        try:
+            if hasattr(os, "sched_getaffinity"):
+                cpus = sorted(os.sched_getaffinity(0))
+            else:
+                cpus = list(range(multiprocessing.cpu_count()))
+        except Exception:
+            return []
+        
+        # Kardeşler arasındaki sıra: 0 = birincil, 1+ = hyperthread kardeşi
+        groups = {}
+        for cpu in cpus:
+            try:
+                with open(f"/sys/devices/system/cpu/cpu{cpu}/topology/thread_siblings_list") as f:
+                    siblings = ProcessPool._parse_cpulist(f.read())
+                rank = sorted(c for c in siblings if c in cpus).index(cpu)
+            except (OSError, ValueError):
+                rank = 0
+            groups.setdefault(rank, []).append(cpu)
+        
+        ordered = []
+        for rank in sorted(groups):
+            group = groups[rank]
+            shift = pin_offset % len(group)
+            ordered.extend(group[shift:] + group[:shift])
+        return ordered
+
+    @staticmethod
+    def _parse_cpulist(cpulist: str) -> List[int]:
+        """sysfs cpulist formatını ("0-3,8-11") çekirdek listesine çevirir"""
+        cpus = []
+        for part in filter(None, cpulist.strip().split(",")):
+            first, _, last = part.partition("-")
+            cpus.extend(range(int(first), int(last or first) + 1))
+        return cpus
+
+    @staticmethod
+    def _numa_nodes() -> Dict[int, int]:
+        """
+        Çekirdek -> NUMA düğümü eşlemesi (Linux sysfs)
+        
+        Tek düğümlü veya sysfs'siz sistemlerde boş dict döner: Worker'lar
+        tüm kuyruklardan eşit olasılıkla çalar.
+        """
+        nodes = {}
+        try:
+            for path in glob.glob("/sys/devices/system/node/node[0-9]*/cpulist"):
+                node = int(os.path.basename(os.path.dirname(path))[4:])
+                with open(path) as f:
+                    for cpu in ProcessPool._parse_cpulist(f.read()):
+                        nodes[cpu] = node
+        except (OSError, ValueError):
+            return {}
+        return nodes if len(set(nodes.values())) > 1 else {}
+
+    def _register_node_queue(self, task_type: TaskType, cpu_id: Optional[int], queue: Any) -> Optional[List[Any]]:
+        """
+        Kuyruğu worker'ın NUMA düğümüne kaydeder
+        
+        Returns:
+            Düğümün kuyruk listesi; NUMA bilgisi yoksa veya worker
+            sabitlenmemişse None
+        """
+        node = self._cpu_nodes.get(cpu_id)
+        if node is None:
+            return None
+        local_queues = self._node_queues[task_type].setdefault(node, [])
+        local_queues.append(queue)
+        return local_queues
+
+    def _io_cpu_id(self, index: int) -> Optional[int]:
+        """
+        Sıra numarası index olan IO worker'ın sabitleneceği çekirdek
+        
+        Otomatik modda CPU worker'larına verilen çekirdeklerden sonra devam eder;
+        cpu_pin_cores verildiyse ayrılmış çekirdeklerin dışındakiler sırayla kullanılır.
+        """
+        cpus = self._io_worker_cpus
+        if not cpus:
+            return None
+        shift = 0 if self._cpu_pin_cores is not None else self._cpu_bound_count
+        return cpus[(index + shift) % len(cpus)]
+    
+    def _free_cpu_id(self, available_cpus: List[int]) -> Optional[int]:
+        """
+        Hiçbir CPU-bound worker'ın sabitlenmediği ilk çekirdeği döndürür
+        
+        Tüm çekirdekler doluysa (oversubscription) None döner: Worker
+        sabitlenmez, scheduler onu boş çekirdeklere taşıyabilir.
+        """
+        used = {w._cpu_id for w in self._cpu_workers}
+        for cpu_id in available_cpus:
+            if cpu_id not in used:
+                return cpu_id
+        return None
+    
     def remove_worker(self, task_type: TaskType) -> bool:
         """Bir worker'ı kapatır (Scale In)"""
         with self._lock:
@@ -315,9 +550,14 @@ class ProcessPool:
                 queue = self._io_queues.pop()
                 self._io_bound_count -= 1
                 
+            for local_queues in self._node_queues[task_type].values():
+                if queue in local_queues:
+                    local_queues.remove(queue)
+                    break
+                
             # Worker'a kapanma sinyali gönder
             try:
-                queue.put({"command": "shutdown"})
+                queue.put((OP_SHUTDOWN, None))
             except:
                 pass
                 
@@ -346,38 +586,40 @@ class ProcessPool:
         
     def get_status(self) -> ComponentStatus:
         """Pool durumu"""
-        cpu_active = sum(w.active_thread_count()[0] for w in self._cpu_workers)
-        io_active = sum(w.active_thread_count()[0] for w in self._io_workers)
-        
         # Her worker'ın aktif görev sayısını topla
+        # Sayaçlar worker başına bir kez okunur; kuyruk boyu active_thread_count()'tan gelir
+        cpu_active = 0
         cpu_worker_tasks = {}
-        for i, worker in enumerate(self._cpu_workers):
+        for worker in self._cpu_workers:
             worker_id = worker._worker_id
             active_tasks, queue_size, thread_pool_queue_size = worker.active_thread_count()
-            try:
-                queue_size = self._cpu_queues[i].qsize() if i < len(self._cpu_queues) else 0
-            except:
-                queue_size = 0  # qsize() bazı platformlarda çalışmayabilir
+            cpu_active += active_tasks
+            # process_metrics shared memory'de: Worker'ın yazdığı değer doğrudan okunur
+            metrics = worker.process_metrics
             cpu_worker_tasks[worker_id] = {
                 "active_tasks": active_tasks,
                 "queue_size": queue_size,
                 "thread_pool_queue_size": thread_pool_queue_size,
-                "total_load": active_tasks + queue_size + thread_pool_queue_size
+                "total_load": active_tasks + queue_size + thread_pool_queue_size,
+                "cpu_usage": metrics[ProcessMetric.CPU],
+                "memory_mb": metrics[ProcessMetric.MEM],
             }
         
+        io_active = 0
         io_worker_tasks = {}
-        for i, worker in enumerate(self._io_workers):
+        for worker in self._io_workers:
             worker_id = worker._worker_id
             active_tasks, queue_size, thread_pool_queue_size = worker.active_thread_count()
-            try:
-                queue_size = self._io_queues[i].qsize() if i < len(self._io_queues) else 0
-            except:
-                queue_size = 0  # qsize() bazı platformlarda çalışmayabilir
+            io_active += active_tasks
+            # process_metrics shared memory'de: Worker'ın yazdığı değer doğrudan okunur
+            metrics = worker.process_metrics
             io_worker_tasks[worker_id] = {
                 "active_tasks": active_tasks,
                 "queue_size": queue_size,
                 "thread_pool_queue_size": thread_pool_queue_size,
-                "total_load": active_tasks + queue_size + thread_pool_queue_size
+                "total_load": active_tasks + queue_size + thread_pool_queue_size,
+                "cpu_usage": metrics[ProcessMetric.CPU],
+                "memory_mb": metrics[ProcessMetric.MEM],
             }
         
         metrics = {
@@ -1,16 +1,28 @@
 """Worker Process - tek bir worker process"""
 
 import multiprocessing
+import multiprocessing.connection
 import os
 from typing import Any, Optional, Callable, List
 import time
 import queue
-from threading import Event
+import random
+from threading import Event, Thread
 import psutil
 
 from ..core.enums import TaskType, ProcessMetric
+from ..task.task import Task
 from .thread import ThreadPool
 
+# Boşta kalan worker'ın tur başına denediği rastgele kurban kuyruk sayısı
+STEAL_PROBES = 2
+
+# Worker mesaj komutları: (komut, veri) - int kodlar string'den küçük
+# pickle edilir ve child'da karşılaştırması tek işlemdir
+OP_EXECUTE_TASK = 0
+OP_EXECUTE_BATCH = 1
+OP_SHUTDOWN = 2
+
 
 class WorkerProcess:
     """
@@ -29,7 +41,9 @@ class WorkerProcess:
         cpu_id: Optional[int] = None,
         nice_level: int = 0,
         my_queue: Any = None,  # Kendi kuyruğu
-        all_queues: List[Any] = None  # Tüm kuyruklar (çalmak için)
+        all_queues: List[Any] = None,  # Tüm kuyruklar (çalmak için)
+        local_queues: Optional[List[Any]] = None,  # Aynı NUMA düğümündeki kuyruklar (önce bunlardan çalınır)
+        ctx: Optional[Any] = None  # multiprocessing context (start method)
     ):
         self._worker_id = worker_id
         self._task_type = task_type
@@ -39,27 +53,33 @@ class WorkerProcess:
         self._nice_level = nice_level
         self._my_queue = my_queue
         self._all_queues = all_queues or []
+        self._local_queues = local_queues
         # executor_func pickle edilemez, process içinde oluşturulacak
         self._executor_func = None
+        self._ctx = ctx or multiprocessing.get_context()
         
         # Process communication
-        self._cmd_pipe, child_pipe = multiprocessing.Pipe()
+        self._cmd_pipe, child_pipe = self._ctx.Pipe()
         self._process: Optional[multiprocessing.Process] = None
         # Event pickle edilemez, process içinde oluşturulacak
         self._child_pipe = child_pipe
         
         # Shared counter for active tasks
-        self._active_task_count = multiprocessing.Value('i', 0)
+        # RawValue: Tek yazan bu worker'ın ThreadPool'u; değer thread'lerin boşta
+        # bayraklarından türetilip doğrudan yazılır (artırma yok), lock gerekmez
+        self._active_task_count = self._ctx.RawValue('i', 0)
         # Shared counter for ThreadPool queue size
-        self.thread_pool_queue_size = multiprocessing.Value('i', 0)
+        # RawValue: Sadece qsize() anlık değeri yazılır (artırma yok), lock gerekmez;
+        # hizalı int yazma/okuma tek bellek erişimidir
+        self.thread_pool_queue_size = self._ctx.RawValue('i', 0)
 
-        self.process_metrics = multiprocessing.Array('d', len(ProcessMetric), lock=False)
+        self.process_metrics = self._ctx.Array('d', len(ProcessMetric), lock=False)
 
     def start(self):
         """Process'i başlat"""
         # executor_func pickle edilemez, None geçiriyoruz
         # Process objesi pickle edilebilir olmalı
-        process = multiprocessing.Process(
+        process = self._ctx.Process(
             target=self._run_process,
             args=(
                 self._child_pipe,
@@ -73,7 +93,9 @@ class WorkerProcess:
                 self._nice_level,
                 self._my_queue,
                 self._all_queues,
-                self.process_metrics
+                self.process_metrics,
+                self._local_queues,
+                self._task_type == TaskType.CPU_BOUND
             )
         )
         process.start()
@@ -82,13 +104,13 @@ class WorkerProcess:
     def submit_task(self, task: Any) -> bool:
         """Görev gönder"""
         try:
-            self._cmd_pipe.send({
-                "command": "execute_task",
-                "task": task.to_dict() if hasattr(task, 'to_dict') else task
-            })
+            self._cmd_pipe.send((
+                OP_EXECUTE_TASK,
+                task.to_tuple() if isinstance(task, Task) else task
+            ))
                 
             return True
-        except:
+        except Exception:
             return False
     
     def shutdown(self):
@@ -97,7 +119,7 @@ class WorkerProcess:
             # Shutdown komutu gönder
             if self._cmd_pipe and not self._cmd_pipe.closed:
                 try:
-                    self._cmd_pipe.send({"command": "shutdown"})
+                    self._cmd_pipe.send((OP_SHUTDOWN, None))
                 except:
                     pass
             
@@ -119,12 +141,20 @@ class WorkerProcess:
     
     def active_thread_count(self) -> tuple:
         """Aktif thread sayısı (yaklaşık)"""
-        return self._active_task_count.value, self._my_queue.qsize(), self.thread_pool_queue_size.value
+        try:
+            queue_size = self._my_queue.qsize()
+        except NotImplementedError:
+            queue_size = 0  # qsize() macOS'ta desteklenmiyor
+        return self._active_task_count.value, queue_size, self.thread_pool_queue_size.value
         
     def increment_load(self):
-        """Yükü artır (Main process'ten çağrılır)"""
-        with self._active_task_count.get_lock():
-            self._active_task_count.value += 1
+        """
+        Yükü artır (Main process'ten çağrılır)
+        
+        Yaklaşık tahmin: Worker'ın ThreadPool'u bir sonraki görev geçişinde
+        sayacı gerçek aktif thread sayısıyla tekrar yazar.
+        """
+        self._active_task_count.value += 1
     
     def __getstate__(self):
         """Pickle için state - sadece pickle edilebilir değerleri döndür"""
@@ -144,6 +174,7 @@ class WorkerProcess:
             '_nice_level': self._nice_level,
             '_my_queue': self._my_queue,
             '_all_queues': self._all_queues,
+            '_local_queues': self._local_queues,
         }
         return state
     
@@ -158,14 +189,30 @@ class WorkerProcess:
         self._executor_func = None
         self._process = None
         self._active_task_count = state['_active_task_count']
-        self.thread_pool_queue_size = state.get('thread_pool_queue_size', multiprocessing.Value('i', 0))
+        self.thread_pool_queue_size = state.get('thread_pool_queue_size', multiprocessing.RawValue('i', 0))
         self._cpu_id = state.get('_cpu_id')
         self._nice_level = state.get('_nice_level', 0)
         self._my_queue = state.get('_my_queue')
         self._all_queues = state.get('_all_queues', [])
+        self._local_queues = state.get('_local_queues')
     
     @staticmethod
-    def _run_process(cmd_pipe, output_queue, executor_func, max_threads, worker_id, active_task_count, thread_pool_queue_size, cpu_id, nice_level, my_queue, all_queues, process_metrics):
+    def _metrics_loop(process_metrics, shutdown_event, interval: float = 1.0):
+        """Process CPU/bellek kullanımını periyodik olarak shared memory'ye yazar"""
+        proc = psutil.Process(os.getpid())
+        proc.cpu_percent(None)
+
+        while not shutdown_event.wait(interval):
+            try:
+                cpu = proc.cpu_percent(None)
+                mem = proc.memory_info().rss / (1024 * 1024)
+            except Exception:
+                continue  # Metrik okunamadı, bir sonraki turda tekrar denenir
+            # İki değer tek slice atamasıyla, ölçümler bittikten sonra yazılır
+            process_metrics[ProcessMetric.CPU:ProcessMetric.MEM + 1] = (cpu, mem)
+
+    @staticmethod
+    def _run_process(cmd_pipe, output_queue, executor_func, max_threads, worker_id, active_task_count, thread_pool_queue_size, cpu_id, nice_level, my_queue, all_queues, process_metrics, local_queues=None, batch_scheduling=False):
         """Process içinde çalışan fonksiyon"""
 
         # 1. Process Önceliğini Ayarla (Nice Value)
@@ -176,11 +223,22 @@ class WorkerProcess:
             except Exception as e:
                 pass  # İzin hatası olabilir, yoksay
 
+        # CPU-bound: SCHED_BATCH ile scheduler uzun dilimler verir, daha az preemption
+        if batch_scheduling and hasattr(os, 'sched_setscheduler'):
+            try:
+                os.sched_setscheduler(0, os.SCHED_BATCH, os.sched_param(0))
+            except Exception:
+                pass  # Desteklenmiyor veya izin yok, yoksay
+
         # 2. CPU Affinity Ayarla (Çekirdek Sabitleme)
         # Process'i belirli bir çekirdeğe kilitler
-        if cpu_id is not None and hasattr(os, 'sched_setaffinity'):
+        if cpu_id is not None:
             try:
-                os.sched_setaffinity(0, {cpu_id})
+                if hasattr(os, 'sched_setaffinity'):
+                    os.sched_setaffinity(0, {cpu_id})
+                elif hasattr(psutil.Process, 'cpu_affinity'):
+                    # Windows: sched_setaffinity yok, psutil üzerinden ayarla
+                    psutil.Process().cpu_affinity([cpu_id])
             except Exception as e:
                 pass  # Desteklenmiyor veya hata, yoksay
 
@@ -199,91 +257,127 @@ class WorkerProcess:
 
         shutdown_event = Event()
 
-        proc = psutil.Process(os.getpid())
-        proc.cpu_percent(None)
-
-        last_metrics_update = 0.0
-        metrics_interval = 1.0
+        # Metrikler ayrı thread'de: İş döngüsü her turda saat okumaz
+        Thread(
+            target=WorkerProcess._metrics_loop,
+            args=(process_metrics, shutdown_event),
+            daemon=True
+        ).start()
+
+        # Çalınabilecek kuyruklar (kendi kuyruğu hariç) bir kez hesaplanır
+        peer_queues = [q for q in all_queues if q is not my_queue] if all_queues else []
+        # NUMA: Önce aynı düğümdeki kuyruklar, bulunamazsa tek uzak kuyruk denenir
+        remote_queues = []
+        if local_queues is not None:
+            local_ids = {id(q) for q in local_queues}
+            remote_queues = [q for q in peer_queues if id(q) not in local_ids]
+            peer_queues = [q for q in peer_queues if id(q) in local_ids]
+
+        # Döngü içinde her turda tekrarlanan attribute/global aramaları bir kez yapılır
+        pool_queue_size = thread_pool.queue_size
+        pool_submit = thread_pool.submit_task
+        # Aynı process'teki ThreadPool'dan doğrudan okunur (shared memory yok)
+        pool_active_count = thread_pool.active_count
+        random_choice = random.choice
+        sleep = time.sleep
+        Empty = queue.Empty
+        has_queue = my_queue is not None
+        pipe_timeout = 0 if has_queue else 0.01
+        # Boşta beklerken kuyruk ve komut pipe'ı birlikte izlenir: shutdown
+        # komutu kuyruk zaman aşımını beklemeden worker'ı uyandırır
+        queue_reader = getattr(my_queue, "_reader", None) if has_queue else None
+        wait_handles = [queue_reader, cmd_pipe] if queue_reader is not None else None
+        wait_ready = multiprocessing.connection.wait
 
         while not shutdown_event.is_set():
 
-            now = time.time()
-            if now - last_metrics_update >= metrics_interval:
-                cpu = proc.cpu_percent(None)
-                mem = proc.memory_info().rss / (1024 * 1024)
-
-                process_metrics[0] = cpu
-                process_metrics[1] = mem
-
-                last_metrics_update = now
-
             request = None
 
-            thread_pool_queue_size_val = thread_pool.queue_size()
+            thread_pool_queue_size_val = pool_queue_size()
 
-            with thread_pool_queue_size.get_lock():
-                thread_pool_queue_size.value = thread_pool_queue_size_val
+            thread_pool_queue_size.value = thread_pool_queue_size_val
 
             if thread_pool_queue_size_val >= max_threads:
-                time.sleep(0.001)
+                sleep(0.001)
                 continue
 
             # Aktif görev sayısı kontrolü (ek güvenlik)
-            if active_task_count.value >= max_threads:
-                time.sleep(0.001)
+            if pool_active_count() >= max_threads:
+                sleep(0.001)
                 continue
 
             # 1. Önce kendi kuyruğuna bak (Öncelikli)
-            if my_queue:
+            # empty(): Lock'suz pipe poll'u; boş kuyrukta Empty exception'ı oluşmaz
+            if has_queue and not my_queue.empty():
                 try:
                     request = my_queue.get_nowait()
-                except queue.Empty:
+                except Empty:
                     pass
 
             # 2. Kendi kuyruğu boşsa, diğerlerinden çal (Work Stealing)
-            if request is None and all_queues:
-                other_queues = []
-
-                for q in all_queues:
-                    if q != my_queue:
-                        try:
-                            size = q.qsize()
-                            if size > 0:
-                                other_queues.append((size, q))
-                        except:
-                            other_queues.append((1, q))
-
-                other_queues.sort(reverse=True, key=lambda x: x[0])
-
-                # En dolu olanlardan başlayarak dene
-                for size, victim_queue in other_queues:
+            # STEAL_PROBES rastgele kurban denenir: qsize() taraması ve sıralama yok
+            if request is None and peer_queues:
+                for _ in range(STEAL_PROBES):
+                    victim_queue = random_choice(peer_queues)
+                    if victim_queue.empty():
+                        continue
                     try:
                         request = victim_queue.get_nowait()
                         break  # Bulduğumuzu al, devam etme
-                    except queue.Empty:
+                    except Empty:
                         continue  # Bir sonrakini dene
 
-            # 3. Hala iş yoksa Pipe'ı kontrol et (Eski usul komutlar için)
+            if request is None and remote_queues:
+                victim_queue = random_choice(remote_queues)
+                if not victim_queue.empty():
+                    try:
+                        request = victim_queue.get_nowait()
+                    except Empty:
+                        pass
+
+            # 3. Hala iş yoksa kendi kuyruğunda bekle: Görev gelir gelmez
+            #    uyanılır (sabit uyku yok); zaman aşımında çalma tekrar denenir
+            if request is None and wait_handles is not None:
+                try:
+                    ready = wait_ready(wait_handles, 0.01)
+                except OSError:
+                    ready = ()
+                # Pipe hazırsa 4. adımda okunur; yalnızca kuyruk hazırsa görev alınır
+                if ready and cmd_pipe not in ready:
+                    try:
+                        request = my_queue.get_nowait()
+                    except Empty:
+                        pass
+            elif request is None and has_queue:
+                try:
+                    request = my_queue.get(timeout=0.01)
+                except Empty:
+                    pass
+
+            # 4. Pipe'ı kontrol et (Eski usul komutlar için)
             if request is None:
                 try:
-                    if cmd_pipe.poll(0.01): # Biraz bekle (CPU'yu yakmamak için)
+                    # Kuyrukta zaten beklendi; kuyruk yoksa burada bekle (CPU'yu yakmamak için)
+                    if cmd_pipe.poll(pipe_timeout):
                         request = cmd_pipe.recv()
-                except:
-                    pass
+                except (OSError, EOFError):
+                    pass  # Pipe kapandı
 
             # İşi işle
             if request:
-                command = request.get("command")
+                # Mesaj: (komut, veri)
+                command, payload = request
+
+                if command == OP_EXECUTE_TASK:
+                    pool_submit(payload)
 
-                if command == "execute_task":
-                    task_dict = request.get("task")
-                    thread_pool.submit_task(task_dict)
+                elif command == OP_EXECUTE_BATCH:
+                    for task_data in payload:
+                        pool_submit(task_data)
 
-                elif command == "shutdown":
+                elif command == OP_SHUTDOWN:
                     shutdown_event.set()
                     break
-            else:
-                time.sleep(0.001)
 
         thread_pool.shutdown()
 
@@ -7,12 +7,16 @@ Her thread görev alır, executor ile çalıştırır ve sonucu queue'ya gönder
 Kullanım:
     pool = ThreadPool(max_threads=20, output_queue=queue)
     pool.start()
-    pool.submit_task(task_dict)
+    pool.submit_task(task.to_tuple())
     pool.shutdown()
 """
 
+import logging
 import threading
-from typing import Any, Optional, Callable, Dict
+import time
+from collections import deque
+from itertools import cycle
+from typing import Any, Optional, Callable, Tuple, Union
 from queue import Queue
 from threading import Event
 
@@ -21,6 +25,20 @@ from ..task.result import Result
 from ..executer.python_executor import PythonExecutor, ExecutionContext
 
 
+# Output queue doluyken sonuç gönderimi en fazla bu aralıkla (saniye) tekrar denenir
+RESULT_RETRY_MAX_DELAY = 0.05
+
+logger = logging.getLogger(__name__)
+
+# Çalınacak görev bulunamadı işareti (None shutdown sinyalidir)
+_NO_TASK = object()
+
+
+def _as_is(result: Result) -> Result:
+    """In-process output queue için sonuç kodlaması (dönüşüm yok)"""
+    return result
+
+
 class ThreadPool:
     """
     Thread Pool - Thread yönetimi
@@ -30,7 +48,8 @@ class ThreadPool:
     
     Özellikler:
     - Thread yönetimi: Belirli sayıda thread oluşturur
-    - Görev dağıtımı: Thread'ler queue'dan görev alır
+    - Görev dağıtımı: Her thread'in kendi deque'si vardır; boştaki thread'ler
+      diğerlerinin deque'sinden görev çalar (work stealing)
     - Executor entegrasyonu: PythonExecutor ile script çalıştırır
     """
     
@@ -45,136 +64,212 @@ class ThreadPool:
     ):
         self._max_threads = max_threads
         self._output_queue = output_queue
-        self._executor_func = executor_func or self._default_executor
+        # Sonuç sadece process sınırını geçerken tuple'a çevrilir;
+        # aynı process'teki queue.Queue'ya Result objesi olduğu gibi konur
+        in_process = isinstance(output_queue, Queue)
+        self._encode = _as_is if in_process else Result.to_tuple
+        # None: Her thread kendi PythonExecutor'ını bir kez oluşturur (_worker_loop)
+        self._executor_func = executor_func
         self._worker_id = worker_id
-        self._active_task_count = active_task_count
+        # Shared counter'a lock'suz yazılır: Değer her seferinde _idle'dan türetilir
+        # (lock'lu Value verilirse ham ctypes nesnesine yazılır)
+        get_obj = getattr(active_task_count, "get_obj", None)
+        self._active_task_count = get_obj() if get_obj is not None else active_task_count
         self._thread_pool_queue_size = thread_pool_queue_size
         
-        self._task_queue: Queue = Queue()
+        # Thread başına deque: Tek Queue'nun mutex'i yerine sahibi tail'den,
+        # çalan thread head'den alır (deque append/pop/popleft GIL altında atomik)
+        self._local_queues = [deque() for _ in range(max_threads)]
+        # Thread başına uyandırma sinyali (boş deque'de uyku)
+        self._wake_events = [Event() for _ in range(max_threads)]
+        self._next_queue = cycle(range(max_threads))
         self._threads: list = []
         self._shutdown_event = Event()
-        self._active_count = 0
-        self._lock = threading.Lock()
+        # Thread başına boşta bayrağı: Her thread sadece kendi slotunu yazar,
+        # aktif sayı lock'suz türetilir (görev başına lock yok)
+        self._idle = [True] * max_threads
     
     def start(self):
         """Thread pool'u başlat"""
         for i in range(self._max_threads):
             thread = threading.Thread(
                 target=self._worker_loop,
+                args=(i,),
                 daemon=True
             )
             thread.start()
             self._threads.append(thread)
     
-    def submit_task(self, task_dict: Dict[str, Any]):
-        """Görev gönder"""
-        self._task_queue.put(task_dict)
-        # Shared counter'ı güncelle
-        if self._thread_pool_queue_size is not None:
-            with self._thread_pool_queue_size.get_lock():
-                self._thread_pool_queue_size.value = self._task_queue.qsize()
+    def submit_task(self, task_data: Union[Task, Tuple]):
+        """Görev gönder (Task objesi veya Task.to_tuple() formatında)"""
+        # Round-robin: Görev sıradaki thread'in deque'sine eklenir ve thread uyandırılır.
+        # Sıradaki meşgulse boştaki bir thread seçilir: Uyuyan thread çalmak için
+        # kendiliğinden uyanmaz, görev meşgul thread'in arkasında beklemesin
+        index = next(self._next_queue)
+        idle = self._idle
+        if not idle[index]:
+            try:
+                index = idle.index(True)
+            except ValueError:
+                pass  # Hepsi meşgul: İlk biten thread kendi deque'sinden/çalarak alır
+        self._local_queues[index].append(task_data)
+        self._wake_events[index].set()
         # Shared counter'ı güncelle
         if self._thread_pool_queue_size is not None:
-            with self._thread_pool_queue_size.get_lock():
-                self._thread_pool_queue_size.value = self._task_queue.qsize()
+            self._thread_pool_queue_size.value = self.queue_size()
     
     def queue_size(self) -> int:
-        """ThreadPool queue'sundaki görev sayısı"""
-        return self._task_queue.qsize()
+        """ThreadPool queue'larındaki toplam görev sayısı"""
+        return sum(map(len, self._local_queues))
     
     def can_accept_task(self) -> bool:
         """Yeni görev kabul edebilir mi? (queue size < max_threads)"""
-        return self._task_queue.qsize() < self._max_threads
+        return self.queue_size() < self._max_threads
     
     def shutdown(self):
         """Thread pool'u kapat"""
+        # Thread'ler her turda shutdown event'ine bakar: Kuyruklara sentinel
+        # eklenmez, sadece uyuyan thread'ler uyandırılır
         self._shutdown_event.set()
-        # Queue'ya None ekle ki thread'ler çıksın
-        for _ in self._threads:
-            try:
-                self._task_queue.put(None)
-            except:
-                pass
+        for wake_event in self._wake_events:
+            wake_event.set()
         
         # Thread'lerin bitmesini bekle (daha uzun timeout)
         for thread in self._threads:
             thread.join(timeout=5.0)
     
-    def _worker_loop(self):
+    def _worker_loop(self, index: int):
         """
         Worker thread loop - Her thread bu döngüde çalışır
         
-        Thread sürekli queue'dan görev alır, çalıştırır ve sonucu gönderir.
+        Thread önce kendi deque'sinin sonundan görev alır; boşsa diğer
+        thread'lerin deque'lerinin başından çalar, hiç iş yoksa uyandırılana
+        kadar bekler (zaman aşımı yok: boştaki thread CPU uyandırması yapmaz).
+        
+        Args:
+            index: Thread'in deque/event indeksi
         """
-        while not self._shutdown_event.is_set():
+        # Execution context thread başına bir kez oluşturulur (script'e geçirilecek)
+        # Görev başına sadece task_id güncellenir
+        context = ExecutionContext(task_id="", worker_id=self._worker_id)
+        own_queue = self._local_queues[index]
+        wake_event = self._wake_events[index]
+        # Çalma sırası: index+1, index+2, ... (thread'ler aynı kurbana yığılmaz)
+        peer_queues = self._local_queues[index + 1:] + self._local_queues[:index]
+        idle = self._idle
+        active_raw = self._active_task_count
+        execute = self._executor_func
+        if execute is None:
+            # Thread başına tek executor: Module cache görevler arasında korunur,
+            # script her görevde yeniden yüklenmez
+            execute = PythonExecutor().execute
+        output_put = self._output_queue.put
+        encode = self._encode
+        put_retry = self._put_retry
+        # Döngüde her turda tekrarlanan attribute aramaları bir kez yapılır
+        shutdown_is_set = self._shutdown_event.is_set
+        steal = self._steal
+        queue_size = self.queue_size
+        queue_size_counter = self._thread_pool_queue_size
+        max_threads = self._max_threads
+        
+        while not shutdown_is_set():
             try:
-                # Queue'dan görev al (timeout ile)
-                task_dict = self._task_queue.get(timeout=0.1)
-                
-                # Shared counter'ı güncelle (görev alındı, queue size azaldı)
-                if self._thread_pool_queue_size is not None:
-                    with self._thread_pool_queue_size.get_lock():
-                        self._thread_pool_queue_size.value = self._task_queue.qsize()
-                
-                if task_dict is None:  # Shutdown signal
-                    break
-                
-                # Aktif thread sayısını artır
-                with self._lock:
-                    self._active_count += 1
-
-                if self._active_task_count is not None:
-                    with self._active_task_count.get_lock():
-                        self._active_task_count.value += 1
-                
-                try:
-                    # Dict'ten Task objesi oluştur
-                    task = Task.from_dict(task_dict)
-                    
-                    # Execution context oluştur (script'e geçirilecek)
-                    context = ExecutionContext(
-                        task_id=task.id,
-                        worker_id=self._worker_id
-                    )
-                    
-                    # Executor ile görevi çalıştır
-                    result = self._executor_func(task, context)
-                    
-                    # Sonucu output queue'ya gönder
-                    if result:
-                        self._output_queue.put(result.to_dict())
+                task_data = own_queue.pop()
+            except IndexError:
+                task_data = steal(peer_queues)
+                if task_data is _NO_TASK:
+                    # Uyumadan önce sayaç tekrar yazılır: Eşzamanlı yazımlarda
+                    # kalmış eski değer düzeltilir
+                    if active_raw is not None:
+                        active_raw.value = max_threads - idle.count(True)
+                    # Görev eklenince submit_task, kapanışta shutdown event'i set eder;
+                    # clear'dan sonra deque'ler döngü başında tekrar kontrol edilir
+                    wake_event.wait()
+                    wake_event.clear()
+                    continue
+            
+            # Shared counter'ı güncelle (görev alındı, queue size azaldı)
+            if queue_size_counter is not None:
+                queue_size_counter.value = queue_size()
+            
+            if task_data is None:  # Shutdown signal (submit_task(None))
+                break
+            
+            item = None
+            
+            # Aktif işaretle
+            idle[index] = False
+            if active_raw is not None:
+                active_raw.value = max_threads - idle.count(True)
+            
+            try:
+                # Aynı process'ten gelen Task objesi tekrar kurulmaz
+                task = task_data if isinstance(task_data, Task) else Task.from_tuple(task_data)
                 
-                except Exception as e:
-                    # Hata durumunda failed result oluştur
-                    # Görev çalıştırılamadı, hata mesajı ile sonuç oluştur
-                    task_id = task_dict.get("task_id", "unknown")
-                    result = Result.failed(
-                        task_id=task_id,
-                        error=str(e)
-                    )
-                    self._output_queue.put(result.to_dict())
+                context.task_id = task.id
                 
-                finally:
-                    # Aktif thread sayısını azalt
-                    with self._lock:
-                        self._active_count -= 1
-                    
-                    # Shared counter'ı azalt (varsa)
-                    if self._active_task_count is not None:
-                        with self._active_task_count.get_lock():
-                            self._active_task_count.value -= 1
+                # Executor ile görevi çalıştır
+                result = execute(task, context)
                 
-            except:
-                # Queue timeout veya başka hata, devam et
-                pass
+                if result:
+                    item = encode(result)
+            
+            except Exception as e:
+                # Hata durumunda failed result oluştur
+                # Görev çalıştırılamadı, hata mesajı ile sonuç oluştur
+                if isinstance(task_data, Task):
+                    task_id = task_data.id
+                else:
+                    task_id = task_data[0] if task_data else "unknown"
+                result = Result.failed(
+                    task_id=task_id,
+                    error=str(e)
+                )
+                item = encode(result)
+            
+            finally:
+                # Boşta işaretle
+                idle[index] = True
+                if active_raw is not None:
+                    active_raw.value = max_threads - idle.count(True)
+            
+            # Sonucu output queue'ya hemen gönder: Tamamlanmış sonuç sıradaki
+            # görevin bitmesini beklemez. OutputQueue doluysa put False döner
+            # (queue.Queue.put bloklar, None döner)
+            if item is not None and output_put(item) is False:
+                put_retry(item)
     
-    def _default_executor(self, task: Task, context: ExecutionContext) -> Result:
-        """Varsayılan executor (PythonExecutor)"""
-        executor = PythonExecutor()
-        return executor.execute(task, context)
+    def _put_retry(self, item: Any):
+        """
+        Dolu output queue'ya sonucu yer açılana kadar tekrar gönderir
+        
+        Sonuç sessizce atılmaz (get_result çağıranı timeout'a kadar bekler);
+        sadece kapanış sırasında hâlâ yer yoksa atılır ve loglanır.
+        """
+        put = self._output_queue.put
+        delay = 0.001
+        while put(item) is False:
+            if self._shutdown_event.is_set():
+                logger.warning(
+                    f"[{self._worker_id}] Output queue dolu, sonuç atıldı "
+                    f"(kapanış sırasında): {item[0] if type(item) is tuple else item.task_id}"
+                )
+                return
+            time.sleep(delay)
+            delay = min(delay * 2, RESULT_RETRY_MAX_DELAY)
+    
+    @staticmethod
+    def _steal(peer_queues: list) -> Any:
+        """Diğer thread'lerin deque'lerinin başından görev çalar; yoksa _NO_TASK"""
+        for peer_queue in peer_queues:
+            try:
+                return peer_queue.popleft()
+            except IndexError:
+                continue
+        return _NO_TASK
     
     def active_count(self) -> int:
         """Aktif thread sayısı"""
-        with self._lock:
-            return self._active_count
+        return self._max_threads - self._idle.count(True)
 
@@ -5,14 +5,18 @@ Gerçek Hayat Örneği: API Client Script'i
 Bu script, harici API'lere istek yapar ve veri toplar.
 """
 
+import asyncio
 import time
 import json
 from typing import Dict, Any, List
 
 
-def main(params: dict, context) -> Dict[str, Any]:
+async def main(params: dict, context) -> Dict[str, Any]:
     """
-    API client fonksiyonu
+    API client fonksiyonu (async)
+    
+    Worker'ın event loop'unda çalışır: Bekleme süresince thread yerine
+    coroutine askıda kalır, aynı process'teki istekler loop'ta örtüşür.
     
     Args:
         params: Görev parametreleri
@@ -30,9 +34,9 @@ def main(params: dict, context) -> Dict[str, Any]:
     timeout = params.get("timeout", 5.0)
     
     # API isteği simülasyonu (IO-bound)
-    # Gerçek hayatta burada requests, httpx vb. kullanılır
+    # Gerçek hayatta burada aiohttp, httpx.AsyncClient vb. kullanılır
     request_time = min(0.5, timeout / 2)  # Network latency
-    time.sleep(request_time)
+    await asyncio.sleep(request_time)
     
     # Simüle edilmiş API yanıtı
     if method == "GET":
@@ -8,6 +8,7 @@ Bu script, gerçek bir veri işleme görevini simüle eder:
 - Sonucu döndürür
 """
 
+import math
 import time
 import json
 from typing import Dict, Any
@@ -46,9 +47,8 @@ def main(params: dict, context) -> Dict[str, Any]:
     if operation == "sum":
         result = sum(fetched_data)
     elif operation == "multiply":
-        result = 1
-        for x in fetched_data:
-            result *= x
+        # math.prod: Çarpım C döngüsünde yapılır, int'lerde sınırsız hassasiyet korunur
+        result = math.prod(fetched_data)
     elif operation == "filter":
         result = [x for x in fetched_data if x % 2 == 0]
     elif operation == "count":
@@ -16,8 +16,13 @@ import multiprocessing
 from pathlib import Path
 
 # Multiprocessing için gerekli
+# forkserver: Worker'lar modülleri önceden yüklenmiş server process'ten fork'lanır
+# (her worker'da yorumlayıcı baştan başlatılmaz); desteklenmeyen platformda spawn
 if __name__ == '__main__':
-    multiprocessing.set_start_method('spawn', force=True)
+    multiprocessing.set_start_method(
+        'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn',
+        force=True
+    )
 
 # Proje root'unu path'e ekle
 project_root = Path(__file__).parent.parent
@@ -0,0 +1,141 @@
+"""
+Atomic Counter Testleri
+
+AtomicCounter'ın artırma, toplu artırma ve eşzamanlı kullanımını test eder.
+"""
+
+import sys
+import threading
+
+import pytest
+
+from cpu_load_balancer.queue.counter import AtomicCounter
+
+
+@pytest.fixture
+def fast_switching():
+    """Thread geçişlerini sıklaştırır: Okumalar arası yarış görünür hale gelir"""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+class TestAtomicCounter:
+    """AtomicCounter testleri"""
+
+    def test_initial_value(self):
+        """Başlangıç değeri testi"""
+        assert AtomicCounter().value == 0
+        assert AtomicCounter(5).value == 5
+
+    def test_increment(self):
+        """increment() sayacı bir artırır"""
+        counter = AtomicCounter()
+
+        counter.increment()
+        counter.increment()
+
+        assert counter.value == 2
+
+    def test_add(self):
+        """add(n) sayacı n kadar artırır; n <= 0 etkisizdir"""
+        counter = AtomicCounter(1)
+
+        counter.add(10)
+        counter.add(0)
+        counter.add(-3)
+
+        assert counter.value == 11
+
+    def test_value_read_does_not_advance(self):
+        """Değer okuma sayacı değiştirmez"""
+        counter = AtomicCounter()
+        counter.add(3)
+
+        assert [counter.value for _ in range(5)] == [3] * 5
+
+        counter.increment()
+        assert counter.value == 4
+
+    def test_concurrent_updates(self):
+        """Eşzamanlı increment/add/value sonrası artış kaybolmaz"""
+        counter = AtomicCounter()
+        thread_count = 8
+        iterations = 10000
+        start = threading.Barrier(thread_count + 1)
+        reads = []
+
+        def worker():
+            start.wait()
+            for i in range(iterations):
+                counter.increment()
+                if i % 100 == 0:
+                    counter.add(5)
+
+        def reader():
+            start.wait()
+            for _ in range(1000):
+                reads.append(counter.value)
+
+        threads = [threading.Thread(target=worker) for _ in range(thread_count)]
+        threads.append(threading.Thread(target=reader))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        expected = thread_count * (iterations + (iterations // 100) * 5)
+        assert counter.value == expected
+        # Tek okuyucunun gördüğü değerler azalmaz ve nihai değeri aşmaz
+        assert reads == sorted(reads)
+        assert all(0 <= value <= expected for value in reads)
+
+    def test_concurrent_readers(self, fast_switching):
+        """Eşzamanlı okuyucular yazma sürerken geri giden veya kayan değer görmez"""
+        counter = AtomicCounter()
+        reader_count = 4
+        iterations = 20000
+        start = threading.Barrier(reader_count + 1)
+        reads = [[] for _ in range(reader_count)]
+
+        def writer():
+            start.wait()
+            for _ in range(iterations):
+                counter.increment()
+
+        def reader(index):
+            start.wait()
+            for _ in range(2000):
+                reads[index].append(counter.value)
+
+        threads = [threading.Thread(target=writer)]
+        threads += [threading.Thread(target=reader, args=(i,)) for i in range(reader_count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert counter.value == iterations
+        for values in reads:
+            assert values == sorted(values)
+            assert all(0 <= value <= iterations for value in values)
+
+    def test_concurrent_readers_without_writes(self, fast_switching):
+        """Yazma yokken eşzamanlı okumalar hep aynı değeri görür"""
+        counter = AtomicCounter(7)
+        start = threading.Barrier(4)
+        seen = set()
+
+        def reader():
+            start.wait()
+            for _ in range(5000):
+                seen.add(counter.value)
+
+        threads = [threading.Thread(target=reader) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert seen == {7}
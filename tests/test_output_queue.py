@@ -0,0 +1,152 @@
+"""
+Output Queue Testleri
+
+OutputQueue'nun tekli/toplu ekleme ve alma çağrıları karışık
+kullanıldığında sıra ve eksiksizliğini test eder.
+"""
+
+import threading
+
+from cpu_load_balancer.queue.output_queue import OutputQueue
+
+
+TIMEOUT = 5.0
+
+
+def _drain_get(queue: OutputQueue, count: int) -> list:
+    items = []
+    for _ in range(count):
+        item = queue.get(timeout=TIMEOUT)
+        assert item is not None
+        items.append(item)
+    return items
+
+
+def _drain_get_many(queue: OutputQueue, count: int, max_items: int) -> list:
+    items = []
+    while len(items) < count:
+        batch = queue.get_many(max_items, timeout=TIMEOUT)
+        assert batch
+        assert len(batch) <= max_items
+        items.extend(batch)
+    return items
+
+
+class TestOutputQueue:
+    """OutputQueue testleri"""
+
+    def test_put_get(self):
+        """Tekli ekleme / alma sırası korunur"""
+        queue = OutputQueue(maxsize=100)
+
+        for i in range(10):
+            assert queue.put(i)
+
+        assert _drain_get(queue, 10) == list(range(10))
+        assert queue.get(timeout=0.05) is None
+
+    def test_put_many_unpacked_by_get(self):
+        """put_many ile eklenen sonuçlar get ile tek tek döner"""
+        queue = OutputQueue(maxsize=100)
+
+        assert queue.put_many([("a", 1), ("b", 2), ("c", 3)])
+        assert queue.put(("d", 4))
+
+        assert _drain_get(queue, 4) == [("a", 1), ("b", 2), ("c", 3), ("d", 4)]
+
+    def test_mixed_put_and_get_many(self):
+        """Karışık put/put_many, get_many ile sırayla ve eksiksiz alınır"""
+        queue = OutputQueue(maxsize=1000)
+        expected = []
+        next_item = 0
+
+        for round_no in range(20):
+            if round_no % 3 == 0:
+                assert queue.put(next_item)
+                expected.append(next_item)
+                next_item += 1
+            else:
+                batch = list(range(next_item, next_item + round_no))
+                assert queue.put_many(batch)
+                expected.extend(batch)
+                next_item += round_no
+
+        # max_items toplu mesajdan küçük: Kalanlar sonraki çağrılara taşınır
+        assert _drain_get_many(queue, len(expected), max_items=4) == expected
+        assert queue.get_many(4, timeout=0.05) == []
+
+    def test_get_and_get_many_interleaved(self):
+        """get ve get_many aynı bekleyen toplu mesajdan sırayla okur"""
+        queue = OutputQueue(maxsize=100)
+        assert queue.put_many(list(range(10)))
+        assert queue.put(10)
+        assert queue.put_many([11, 12])
+
+        items = [queue.get(timeout=TIMEOUT)]
+        items += queue.get_many(3, timeout=TIMEOUT)
+        items.append(queue.get(timeout=TIMEOUT))
+        items += _drain_get_many(queue, 13 - len(items), max_items=5)
+
+        assert items == list(range(13))
+
+    def test_counters(self):
+        """total_put / total_get toplu mesajlarda sonuç başına sayılır"""
+        queue = OutputQueue(maxsize=100)
+        queue.put(1)
+        queue.put_many([2, 3, 4])
+
+        _drain_get(queue, 1)
+        _drain_get_many(queue, 3, max_items=10)
+
+        metrics = queue.get_status().metrics
+        assert metrics["total_put"] == 4
+        assert metrics["total_get"] == 4
+
+    def test_put_full(self):
+        """Queue doluysa put / put_many False döner"""
+        queue = OutputQueue(maxsize=1)
+
+        assert queue.put(1)
+        assert queue.put(2) is False
+        assert queue.put_many([3, 4]) is False
+
+        assert queue.get(timeout=TIMEOUT) == 1
+
+    def test_concurrent_producers(self):
+        """Eşzamanlı üreticilerden gelen sonuçlar eksiksiz ve üretici sırasıyla alınır"""
+        queue = OutputQueue(maxsize=10000)
+        producers = 4
+        per_producer = 500
+
+        def producer(n):
+            i = 0
+            while i < per_producer:
+                if i % 2:
+                    assert queue.put((n, i))
+                    i += 1
+                else:
+                    batch = [(n, j) for j in range(i, min(i + 7, per_producer))]
+                    assert queue.put_many(batch)
+                    i += len(batch)
+
+        threads = [threading.Thread(target=producer, args=(n,)) for n in range(producers)]
+        for thread in threads:
+            thread.start()
+
+        items = []
+        total = producers * per_producer
+        while len(items) < total:
+            if len(items) % 2:
+                item = queue.get(timeout=TIMEOUT)
+                assert item is not None
+                items.append(item)
+            else:
+                items.extend(_drain_get_many(queue, 1, max_items=16))
+
+        for thread in threads:
+            thread.join()
+
+        assert len(items) == total
+        assert sorted(items) == [(n, i) for n in range(producers) for i in range(per_producer)]
+        for n in range(producers):
+            assert [i for p, i in items if p == n] == list(range(per_producer))
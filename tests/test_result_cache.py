@@ -0,0 +1,180 @@
+"""
+Result Cache Testleri
+
+ShardedResultCache'in ekleme/okuma, bekleme ve LRU davranışını test eder.
+"""
+
+import threading
+import time
+
+import pytest
+
+from cpu_load_balancer.core.result_cache import ShardedResultCache
+from cpu_load_balancer.task.result import Result
+
+
+def _result(task_id: str) -> Result:
+    return Result.success(task_id=task_id, data={"id": task_id})
+
+
+def _same_shard_ids(cache: ShardedResultCache, count: int) -> list:
+    """Aynı shard'a düşen task ID'leri (shard seçimi hash'e bağlı)"""
+    first = "task-0"
+    ids = [first]
+    i = 1
+    while len(ids) < count:
+        task_id = f"task-{i}"
+        if cache._get_shard(task_id) is cache._get_shard(first):
+            ids.append(task_id)
+        i += 1
+    return ids
+
+
+class TestShardedResultCache:
+    """ShardedResultCache testleri"""
+
+    def test_invalid_config(self):
+        """Geçersiz shard sayısı / boyut testi"""
+        with pytest.raises(ValueError):
+            ShardedResultCache(shard_count=3)
+
+        with pytest.raises(ValueError):
+            ShardedResultCache(shard_count=4, max_size_per_shard=0)
+
+    def test_put_get_pop(self):
+        """Ekleme, silmeden okuma ve alıp silme testi"""
+        cache = ShardedResultCache(shard_count=4, max_size_per_shard=8)
+        result = _result("a")
+
+        cache.put("a", result)
+
+        assert cache.get("a") is result
+        assert "a" in cache
+        assert cache.size() == 1
+
+        assert cache.pop("a") is result
+        assert "a" not in cache
+        assert cache.pop("a") is None
+        assert cache.get("a") is None
+        assert cache.size() == 0
+
+    def test_put_overwrite_keeps_size(self):
+        """Aynı görev tekrar eklenince boyut artmaz"""
+        cache = ShardedResultCache(shard_count=2, max_size_per_shard=8)
+
+        cache.put("a", _result("a"))
+        replacement = _result("a")
+        cache.put("a", replacement)
+
+        assert cache.size() == 1
+        assert cache.pop("a") is replacement
+
+    def test_put_many(self):
+        """Toplu ekleme testi"""
+        cache = ShardedResultCache(shard_count=8, max_size_per_shard=64)
+        ids = [f"task-{i}" for i in range(100)]
+
+        cache.put_many((task_id, _result(task_id)) for task_id in ids)
+
+        assert cache.size() == len(ids)
+        assert all(cache.pop(task_id).task_id == task_id for task_id in ids)
+        assert len(cache) == 0
+
+    def test_wait_pop_timeout(self):
+        """Sonuç gelmezse wait_pop timeout sonrası None döner"""
+        cache = ShardedResultCache(shard_count=2)
+
+        started = time.monotonic()
+        assert cache.wait_pop("missing", timeout=0.1) is None
+        elapsed = time.monotonic() - started
+
+        assert elapsed >= 0.1
+        assert elapsed < 2.0
+        # Bekleyen kaydı temizlenmiş olmalı
+        assert not cache._get_shard("missing").waiters
+
+    def test_wait_pop_existing(self):
+        """Sonuç zaten varsa wait_pop beklemeden döner"""
+        cache = ShardedResultCache(shard_count=2)
+        result = _result("a")
+        cache.put("a", result)
+
+        assert cache.wait_pop("a", timeout=0) is result
+        assert cache.size() == 0
+
+    @pytest.mark.parametrize("batch", [False, True])
+    def test_wait_pop_wakeup(self, batch):
+        """put / put_many bekleyen wait_pop'u uyandırır"""
+        cache = ShardedResultCache(shard_count=4)
+        result = _result("a")
+        received = []
+
+        waiter = threading.Thread(target=lambda: received.append(cache.wait_pop("a", timeout=5.0)))
+        waiter.start()
+        time.sleep(0.05)
+
+        started = time.monotonic()
+        if batch:
+            cache.put_many([("b", _result("b")), ("a", result)])
+        else:
+            cache.put("a", result)
+        waiter.join(timeout=5.0)
+
+        assert not waiter.is_alive()
+        assert received == [result]
+        assert time.monotonic() - started < 1.0
+        assert "a" not in cache
+
+    def test_lru_eviction(self):
+        """Shard dolunca en eski sonuç atılır; okunan sonuç en yeniye taşınır"""
+        cache = ShardedResultCache(shard_count=4, max_size_per_shard=2)
+        first, second, third = _same_shard_ids(cache, 3)
+
+        cache.put(first, _result(first))
+        cache.put(second, _result(second))
+        cache.get(first)  # first en yeni olur
+        cache.put(third, _result(third))
+
+        assert first in cache
+        assert second not in cache
+        assert third in cache
+        assert cache.size() == 2
+
+    def test_lru_eviction_across_shards(self):
+        """Her shard kendi sınırını uygular; toplam boyut shard toplamını aşmaz"""
+        shard_count = 4
+        max_size = 3
+        cache = ShardedResultCache(shard_count=shard_count, max_size_per_shard=max_size)
+        ids = [f"task-{i}" for i in range(200)]
+
+        for task_id in ids[:100]:
+            cache.put(task_id, _result(task_id))
+        cache.put_many((task_id, _result(task_id)) for task_id in ids[100:])
+
+        assert cache.size() == shard_count * max_size
+        assert sum(len(shard.cache) for shard in cache._shards) == cache.size()
+
+        # Her shard'da kalanlar, o shard'a düşen son max_size görevdir
+        for shard in cache._shards:
+            expected = [task_id for task_id in ids if cache._get_shard(task_id) is shard][-max_size:]
+            assert list(shard.cache) == expected
+
+    def test_size_concurrent(self):
+        """Eşzamanlı put/pop sonrası size() tutarlıdır"""
+        cache = ShardedResultCache(shard_count=8, max_size_per_shard=1000)
+
+        def worker(prefix):
+            for i in range(500):
+                task_id = f"{prefix}-{i}"
+                cache.put(task_id, _result(task_id))
+                if i % 2:
+                    assert cache.pop(task_id) is not None
+
+        threads = [threading.Thread(target=worker, args=(f"t{n}",)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert cache.size() == 4 * 250
+        assert sum(len(shard.cache) for shard in cache._shards) == cache.size()